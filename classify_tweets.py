@@ -1,9 +1,9 @@
 #!/Users/pentester/Tools/gemma-3n/venv/bin/python3
 """
-classify_tweets.py - Directly run the tweet_classifier.py script on tweets.json
+classify_tweets.py - Directly run the tweet_classifier on tweets.json
 
-This script loads tweets from tweets.json, runs them through the tweet_classifier.py script
-using the first 5 fewshots, and saves the results to classified.json.
+This script loads tweets from tweets.json, runs them through tweet_classifier (imported
+as a module rather than spawned as a script) using the first 5 fewshots, and saves the results to classified.json.
 This avoids the Prometheus metrics collision error that happens when running
 the src.wdf.tasks.classify module directly.
 
@@ -14,12 +14,17 @@ Usage:
 import argparse
 import json
 import logging
-import subprocess
 import sys
 from pathlib import Path
 
 import structlog
 
+import tweet_classifier
+
+# Shared JSON helpers from the wdf package
+sys.path.append(str(Path(__file__).parent / "src"))
+from wdf.json_utils import dumps, loads
+
 # Set up structured logging
 logger = structlog.get_logger()
 
@@ -38,8 +43,7 @@ def load_tweets() -> list:
         List of tweet dictionaries
     """
     try:
-        with open(TWEETS_PATH, "r") as f:
-            tweets = json.load(f)
+        tweets = loads(TWEETS_PATH.read_bytes())
             
         logger.info(
             "Loaded tweets",
@@ -58,7 +62,7 @@ def load_tweets() -> list:
 
 def classify_tweets(tweets: list, verbose: bool = False) -> list:
     """
-    Classify tweets using the tweet_classifier.py script
+    Classify tweets by calling tweet_classifier in-process
     
     Args:
         tweets: List of tweet dictionaries
@@ -67,96 +71,31 @@ def classify_tweets(tweets: list, verbose: bool = False) -> list:
     Returns:
         List of tweet dictionaries with classifications added
     """
-    # Create a temporary file with one tweet per line
-    tweets_file = Path("temp_tweets_to_classify.txt")
-    with open(tweets_file, "w") as f:
-        for tweet in tweets:
-            f.write(f"{tweet['text']}\n")
-    
-    # Build the command
-    cmd = [
-        sys.executable,
-        "tweet_classifier.py",
-        "--input-file", str(tweets_file),
-        "--summary-file", str(SUMMARY_PATH),
-        "--no-cache",  # Avoid caching for pipeline runs
-        "--random",    # Use random examples for better diversity
-        "--max-examples", "5",  # Use only first 20 fewshots as requested
-    ]
-    
-    if verbose:
-        cmd.append("--debug")
-    
-    # Run the classifier
     logger.info(
-        "Running tweet_classifier.py with first 5 fewshots only",
-        cmd=" ".join(cmd)
+        "Running tweet_classifier with first 5 fewshots only",
+        count=len(tweets)
     )
     
     try:
-        result = subprocess.run(
-            cmd,
-            check=True,
-            capture_output=True,
-            text=True
+        # Random examples from the first 5 fewshots, no response cache
+        classifications = tweet_classifier.classify(
+            [tweet["text"] for tweet in tweets],
+            max_examples=5,
+            random=True,
+            summary_file=str(SUMMARY_PATH),
+            debug=verbose
         )
         
-        # Parse the output using regex pattern matching
-        import re
-        
-        # Look for lines like "Result: RELEVANT" or "Result: SKIP"
-        result_pattern = re.compile(r"Result:\s*(RELEVANT|SKIP)")
-        classifications = []
-        
-        lines = result.stdout.splitlines()
-        
-        for line in lines:
-            match = result_pattern.search(line)
-            if match:
-                classification = match.group(1).strip()
-                classifications.append(classification)
-        
-        # Add classifications to tweets
-        if len(classifications) != len(tweets):
-            logger.error(
-                "Number of classifications doesn't match number of tweets",
-                tweets=len(tweets),
-                classifications=len(classifications)
-            )
-            raise ValueError("Classification count mismatch")
-            
         for tweet, classification in zip(tweets, classifications):
             tweet["classification"] = classification
         
-        # Clean up
-        tweets_file.unlink()
-        
         return tweets
         
-    except subprocess.CalledProcessError as e:
-        logger.error(
-            "tweet_classifier.py failed",
-            returncode=e.returncode,
-            stdout=e.stdout,
-            stderr=e.stderr
-        )
-        
-        # Clean up
-        if tweets_file.exists():
-            tweets_file.unlink()
-            
-        raise RuntimeError(f"tweet_classifier.py failed: {e}")
-        
     except Exception as e:
         logger.error(
-            "Error running tweet_classifier.py",
+            "Error running tweet_classifier",
             error=str(e)
         )
-        
-        # Clean up
-        if tweets_file.exists():
-            tweets_file.unlink()
-            
         raise
 
 
@@ -167,15 +106,20 @@ def save_classified_tweets(tweets: list) -> None:
     Args:
         tweets: List of tweet dictionaries with classifications
     """
-    with open(CLASSIFIED_PATH, "w") as f:
-        json.dump(tweets, f, indent=2)
+    CLASSIFIED_PATH.write_bytes(dumps(tweets, indent=True))
+    
+    relevant_count = skip_count = 0
+    for tweet in tweets:
+        classification = tweet.get("classification")
+        relevant_count += classification == "RELEVANT"
+        skip_count += classification == "SKIP"
         
     logger.info(
         "Wrote classified tweets to file",
         path=str(CLASSIFIED_PATH),
         count=len(tweets),
-        relevant_count=sum(1 for t in tweets if t.get("classification") == "RELEVANT"),
-        skip_count=sum(1 for t in tweets if t.get("classification") == "SKIP")
+        relevant_count=relevant_count,
+        skip_count=skip_count
     )
 
 
@@ -187,7 +131,7 @@ def main() -> int:
         Exit code
     """
     parser = argparse.ArgumentParser(
-        description="Directly run the tweet_classifier.py script on tweets.json"
+        description="Directly run the tweet_classifier on tweets.json"
     )
     parser.add_argument(
         "--verbose", 
@@ -201,10 +145,13 @@ def main() -> int:
     log_level = logging.DEBUG if args.verbose else logging.INFO
     logging.basicConfig(level=log_level)
     structlog.configure(
+        # Drop below-level calls before any processor runs
+        wrapper_class=structlog.make_filtering_bound_logger(log_level),
         processors=[
             structlog.processors.TimeStamper(fmt="iso"),
             structlog.processors.JSONRenderer()
-        ]
+        ],
+        cache_logger_on_first_use=True
     )
     
     try:
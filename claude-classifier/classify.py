@@ -4,15 +4,24 @@ Claude-based tweet classification without few-shots.
 Directly classifies tweets using Claude's reasoning capabilities.
 """
 
+import hashlib
 import json
+import re
+import sqlite3
 import subprocess
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Dict, Tuple, Optional
 import argparse
 import logging
 
+# Shared JSON helpers from the wdf package
+sys.path.append(str(Path(__file__).parent.parent / "src"))
+from wdf.json_utils import dumps, loads
+
 # Set up logging
 logging.basicConfig(
     level=logging.INFO,
@@ -26,12 +35,103 @@ PARENT_DIR = SCRIPT_DIR.parent
 CLAUDE_MD = SCRIPT_DIR / "CLAUDE.md"
 EPISODE_CONTEXT_FILE = SCRIPT_DIR / "EPISODE_CONTEXT.md"
 
+# Claude CLI invocation. Run from SCRIPT_DIR so the CLI picks up CLAUDE.md as
+# project memory (and caches it), with the prompt itself passed on stdin.
+CLAUDE_CMD = ["claude", "--model", "sonnet", "--print"]
+
+# Summary lines that describe a main topic of the episode
+TOPIC_LINE_PATTERN = re.compile(r"discusses|explains|argues|proposes|explores", re.IGNORECASE)
+
+# Classification results keyed by prompt context + normalized tweet text
+CACHE_FILE = SCRIPT_DIR / "cache" / "classification_cache.db"
+
+
+class ClassificationCache:
+    """
+    Exact-match cache of tweet classifications in SQLite.
+    
+    Keys cover CLAUDE.md and the episode context as well as the tweet, so
+    editing either invalidates earlier scores.
+    """
+    
+    def __init__(self, cache_file: Path = CACHE_FILE):
+        """
+        Open (or create) the cache database.
+        
+        Args:
+            cache_file: SQLite file for cached classifications
+        """
+        cache_file.parent.mkdir(exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(cache_file), check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS classifications "
+            "(key TEXT PRIMARY KEY, score REAL NOT NULL, reason TEXT)"
+        )
+        self._conn.commit()
+    
+    @staticmethod
+    def normalize(tweet_text: str) -> str:
+        """Fold case and whitespace, which don't change the classification."""
+        return ' '.join(tweet_text.lower().split())
+    
+    @staticmethod
+    def make_key(context_digest: str, tweet_text: str) -> str:
+        """Build the cache key for a tweet under a given prompt context."""
+        h = hashlib.blake2b(context_digest.encode(), digest_size=16)
+        h.update(b"\x1f")
+        h.update(ClassificationCache.normalize(tweet_text).encode())
+        return h.hexdigest()
+    
+    def get_many(self, keys: List[str]) -> Dict[str, Tuple[float, Optional[str]]]:
+        """Look up cached (score, reason) pairs for the given keys."""
+        found = {}
+        unique = list(dict.fromkeys(keys))
+        with self._lock:
+            # Stay well under SQLite's bound-parameter limit
+            for i in range(0, len(unique), 500):
+                chunk = unique[i:i+500]
+                rows = self._conn.execute(
+                    f"SELECT key, score, reason FROM classifications "
+                    f"WHERE key IN ({','.join('?' * len(chunk))})",
+                    chunk
+                ).fetchall()
+                found.update((key, (score, reason)) for key, score, reason in rows)
+        return found
+    
+    def put_many(self, entries: List[Tuple[str, float, Optional[str]]]):
+        """Store (key, score, reason) entries."""
+        if not entries:
+            return
+        with self._lock:
+            # Upsert rather than REPLACE so a score stored without a reason
+            # doesn't wipe the reason an earlier run recorded for the same key
+            self._conn.executemany(
+                "INSERT INTO classifications (key, score, reason) VALUES (?, ?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET score = excluded.score, "
+                "reason = COALESCE(excluded.reason, classifications.reason)",
+                entries
+            )
+            self._conn.commit()
+
+
 class ClaudeClassifier:
     """Direct tweet classification using Claude's reasoning."""
     
-    def __init__(self, episode_id: str = None):
-        """Initialize classifier with optional episode context."""
+    def __init__(self, episode_id: str = None, max_workers: int = 1,
+                 use_cache: bool = False):
+        """
+        Initialize classifier with optional episode context.
+        
+        Args:
+            episode_id: Optional episode ID for context
+            max_workers: Maximum concurrent Claude calls in classify_batch
+                (1 keeps the original sequential behaviour)
+            use_cache: Reuse earlier classifications of identical tweets
+                from the SQLite cache (off unless asked for)
+        """
         self.episode_id = episode_id
+        self.max_workers = max_workers
         self.episode_context = ""
         
         # Verify CLAUDE.md exists
@@ -40,6 +140,12 @@ class ClaudeClassifier:
         
         # Load episode context if available
         self.load_episode_context()
+        
+        self.cache = ClassificationCache() if use_cache else None
+        self._context_digest = hashlib.blake2b(
+            CLAUDE_MD.read_bytes() + b"\x1f" + self.episode_context.encode(),
+            digest_size=16
+        ).hexdigest()
     
     def load_episode_context(self):
         """Load episode-specific context from summary if available."""
@@ -57,27 +163,25 @@ class ClaudeClassifier:
             logger.warning("No summary found for episode context")
             return
         
-        summary = summary_path.read_text()
+        # Split once and reuse the lines for both the guest and topic scans
+        lines = summary_path.read_text().split('\n')
         
         # Extract key sections for classification context
         context_parts = ["# Current Episode Context\n"]
         
         # Extract guest info
-        if "guest" in summary.lower():
-            lines = summary.split('\n')
-            for i, line in enumerate(lines):
-                if "guest" in line.lower() and i < len(lines) - 1:
-                    context_parts.append(f"## Guest: {lines[i+1].strip()}\n")
-                    break
+        for i, line in enumerate(lines[:-1]):
+            if "guest" in line.lower():
+                context_parts.append(f"## Guest: {lines[i+1].strip()}\n")
+                break
         
         # Extract main topics (first few key points)
         context_parts.append("\n## Main Topics:\n")
         key_topics = []
-        for line in summary.split('\n'):
+        for line in lines:
             if line.strip() and not line.startswith('#'):
                 # Look for substantive content lines
-                if any(word in line.lower() for word in 
-                       ['discusses', 'explains', 'argues', 'proposes', 'explores']):
+                if TOPIC_LINE_PATTERN.search(line):
                     key_topics.append(f"- {line.strip()}")
                     if len(key_topics) >= 5:
                         break
@@ -86,7 +190,7 @@ class ClaudeClassifier:
         # Extract keywords if available
         keywords_path = PARENT_DIR / "transcripts" / "keywords.json"
         if keywords_path.exists():
-            keywords = json.loads(keywords_path.read_text())
+            keywords = loads(keywords_path.read_bytes())
             context_parts.append(f"\n## Keywords: {', '.join(keywords[:10])}\n")
         
         self.episode_context = '\n'.join(context_parts)
@@ -106,6 +210,12 @@ class ClaudeClassifier:
         Returns:
             Dict with score and optionally reasoning
         """
+        cache_key = ClassificationCache.make_key(self._context_digest, tweet_text)
+        if self.cache:
+            cached = self.cache.get_many([cache_key]).get(cache_key)
+            if cached and (cached[1] is not None or not with_reasoning):
+                return self._cached_result(cached, with_reasoning)
+        
         # Build prompt
         if with_reasoning:
             prompt = f"""Based on the podcast context and classification criteria, score this tweet's relevance and explain why.
@@ -128,152 +238,229 @@ Output only the numerical score:"""
         
         # Call Claude
         result = self._call_claude(prompt)
+        if result is None:
+            return {"score": 0.0, "classification": "SKIP", "error": "Claude call failed"}
         
         # Parse result
         if with_reasoning:
-            return self._parse_score_and_reason(result)
+            parsed = self._parse_score_and_reason(result)
         else:
             try:
                 score = float(result.strip())
-                return {"score": score, "classification": "RELEVANT" if score >= 0.70 else "SKIP"}
+                parsed = {"score": score, "classification": "RELEVANT" if score >= 0.70 else "SKIP"}
             except ValueError:
                 logger.error(f"Failed to parse score: {result}")
                 return {"score": 0.0, "classification": "SKIP", "error": "Parse error"}
+        
+        if self.cache and "error" not in parsed:
+            self.cache.put_many([(cache_key, parsed["score"], parsed.get("reason"))])
+        return parsed
     
-    def classify_batch(self, tweets: List[str], batch_size: int = 20) -> List[Dict]:
+    def classify_batch(self, tweets: List[str], batch_size: int = 20,
+                       with_reasoning: bool = False) -> List[Dict]:
         """
         Classify multiple tweets efficiently in batches.
         
+        Duplicates are sent to Claude only once. Tweets count as duplicates when
+        they match after lowercasing and collapsing whitespace (the cache key's
+        normalization), so e.g. "Go  Home" and "go home" share one score.
+        
         Args:
             tweets: List of tweet texts
             batch_size: Number of tweets per Claude call
+            with_reasoning: Include reasoning explanation for each tweet
             
         Returns:
-            List of classification results
+            List of classification results, one per input tweet, in input order
         """
-        results = []
-        total_batches = (len(tweets) + batch_size - 1) // batch_size
+        keys = [ClassificationCache.make_key(self._context_digest, tweet) for tweet in tweets]
+        known: Dict[str, Dict] = {}
+        if self.cache:
+            for key, cached in self.cache.get_many(keys).items():
+                if cached[1] is not None or not with_reasoning:
+                    known[key] = self._cached_result(cached, with_reasoning)
+            if known:
+                logger.info(f"Reusing cached classifications for {len(known)} tweets")
         
-        for i in range(0, len(tweets), batch_size):
-            batch = tweets[i:i+batch_size]
-            batch_num = i // batch_size + 1
-            logger.info(f"Processing batch {batch_num}/{total_batches} ({len(batch)} tweets)")
-            
-            # Build batch prompt
-            tweet_list = '\n'.join([f"{j+1}. {tweet}" for j, tweet in enumerate(batch)])
-            prompt = f"""Score each tweet from 0.00 to 1.00 based on relevance to the WDF podcast.
-Output one score per line, in order, with no other text.
+        # Only send tweets that aren't cached, and each distinct (normalized) tweet only once
+        pending = {}
+        for tweet, key in zip(tweets, keys):
+            if key not in known and key not in pending:
+                pending[key] = tweet
+        pending_keys = list(pending)
+        pending_tweets = list(pending.values())
+
+        unique_count = len(set(keys))
+        if unique_count < len(tweets):
+            logger.info(f"Deduplicated {len(tweets)} tweets to {unique_count} unique "
+                        f"({unique_count / len(tweets):.0%})")
+
+        batches = [pending_tweets[i:i+batch_size] for i in range(0, len(pending_tweets), batch_size)]
+        batch_keys = [pending_keys[i:i+batch_size] for i in range(0, len(pending_keys), batch_size)]
+        # Everything before the tweet list is the same for every batch, so build
+        # it once; the byte-identical prefix also lets prompt caching kick in
+        if with_reasoning:
+            prefix = """Score each tweet from 0.00 to 1.00 based on relevance to the WDF podcast and explain why.
+Output one line per tweet, in order, with no other text, formatted as:
+<tweet number>\t<score>\t<one-sentence reason>
 
 TWEETS:
-{tweet_list}
+"""
+            suffix = "\n\nRESULTS (one line per tweet, format: '<idx>\t<score>\t<reason>'):"
+        else:
+            prefix = """Score each tweet from 0.00 to 1.00 based on relevance to the WDF podcast.
+Output one line per tweet, in order, with no other text, formatted as:
+<tweet number>\t<score>
 
-SCORES (one per line):"""
-            
-            # Add episode context if available
-            if self.episode_context:
-                prompt = f"{self.episode_context}\n\n{prompt}"
-            
-            # Call Claude
-            response = self._call_claude(prompt)
-            
-            # Parse scores
-            scores = self._parse_batch_scores(response, len(batch))
+TWEETS:
+"""
+            suffix = "\n\nSCORES (one line per tweet, format: '<idx>\t<score>'):"
+        
+        # Add episode context if available
+        if self.episode_context:
+            prefix = f"{self.episode_context}\n\n{prefix}"
+        
+        prompts = []
+        for batch_num, batch in enumerate(batches, 1):
+            logger.info(f"Processing batch {batch_num}/{len(batches)} ({len(batch)} tweets)")
+            tweet_list = '\n'.join([f"{j+1}. {tweet}" for j, tweet in enumerate(batch)])
+            prompts.append(prefix + tweet_list + suffix)
+        
+        # Calls are I/O bound on the CLI, so run batches concurrently;
+        # map keeps responses in batch order
+        with ThreadPoolExecutor(max_workers=max(1, min(self.max_workers, len(prompts)))) as executor:
+            responses = list(executor.map(self._call_claude, prompts))
+        
+        new_entries = []
+        for batch, keys_in_batch, response in zip(batches, batch_keys, responses):
+            if response is None:
+                parsed = [{"score": 0.0, "classification": "SKIP", "error": "Claude call failed"}
+                          for _ in batch]
+            else:
+                parsed = self._parse_batch_results(response, len(batch), with_reasoning)
             
-            # Create results
-            for tweet, score in zip(batch, scores):
-                results.append({
-                    "text": tweet,
-                    "score": score,
-                    "classification": "RELEVANT" if score >= 0.70 else "SKIP"
-                })
+            for key, result in zip(keys_in_batch, parsed):
+                known[key] = result
+                if "error" not in result:
+                    new_entries.append((key, result["score"], result.get("reason")))
         
-        return results
+        if self.cache:
+            self.cache.put_many(new_entries)
+        
+        # Create results, in input order
+        return [{"text": tweet, **known[key]} for tweet, key in zip(tweets, keys)]
     
-    def _call_claude(self, prompt: str) -> str:
-        """Call Claude CLI with the given prompt."""
+    @staticmethod
+    def _cached_result(cached: Tuple[float, Optional[str]], with_reasoning: bool) -> Dict:
+        """Build a classification result from a cached (score, reason) pair."""
+        score, reason = cached
+        result = {"score": score, "classification": "RELEVANT" if score >= 0.70 else "SKIP"}
+        if with_reasoning:
+            result["reason"] = reason
+        return result
+    
+    def _call_claude(self, prompt: str) -> Optional[str]:
+        """Call Claude CLI with the given prompt. Returns None if the call fails."""
         try:
-            # Write prompt to temp file to avoid shell escaping issues
-            temp_prompt = SCRIPT_DIR / ".temp_prompt.txt"
-            temp_prompt.write_text(prompt)
-            
-            # Build command
-            cmd = [
-                "claude",
-                "--model", "sonnet",
-                "--print",
-                f"@{CLAUDE_MD}",
-                f"@{temp_prompt}"
-            ]
-            
-            # Execute
+            # Pass the prompt on stdin - no temp file to write and clean up, and
+            # CLAUDE.md isn't sent a second time on top of the project memory
             result = subprocess.run(
-                cmd,
+                CLAUDE_CMD,
+                input=prompt,
                 capture_output=True,
                 text=True,
                 cwd=SCRIPT_DIR
             )
             
-            # Clean up temp file
-            temp_prompt.unlink(missing_ok=True)
-            
             if result.returncode != 0:
                 logger.error(f"Claude CLI error: {result.stderr}")
-                return "0.00"  # Default to not relevant on error
+                return None  # Callers default to not relevant
             
             return result.stdout.strip()
             
         except Exception as e:
             logger.error(f"Error calling Claude: {e}")
-            return "0.00"
+            return None
     
     def _parse_score_and_reason(self, response: str) -> Dict:
         """Parse score and reasoning from Claude response."""
-        try:
-            lines = response.strip().split('\n')
-            score_line = next((l for l in lines if l.startswith("SCORE:")), None)
-            reason_line = next((l for l in lines if l.startswith("REASON:")), None)
-            
-            if score_line:
-                score = float(score_line.replace("SCORE:", "").strip())
-            else:
-                score = 0.0
-            
-            reason = reason_line.replace("REASON:", "").strip() if reason_line else ""
-            
-            return {
-                "score": score,
-                "classification": "RELEVANT" if score >= 0.70 else "SKIP",
-                "reason": reason
-            }
-        except Exception as e:
-            logger.error(f"Error parsing score and reason: {e}")
-            return {"score": 0.0, "classification": "SKIP", "error": str(e)}
-    
-    def _parse_batch_scores(self, response: str, expected_count: int) -> List[float]:
-        """Parse batch scores from Claude response."""
-        scores = []
-        lines = response.strip().split('\n')
+        score = 0.0
+        reason = ""
         
-        for line in lines:
-            line = line.strip()
-            if line:
+        # One pass over the lines; partition splits each on its first colon only
+        for line in response.splitlines():
+            head, sep, tail = line.partition(":")
+            if not sep:
+                continue
+            head = head.strip()
+            if head == "SCORE":
                 try:
-                    score = float(line)
-                    scores.append(max(0.0, min(1.0, score)))  # Clamp to [0, 1]
-                except ValueError:
-                    logger.warning(f"Skipping invalid score: {line}")
+                    score = float(tail.strip())
+                except ValueError as e:
+                    logger.error(f"Error parsing score and reason: {e}")
+                    return {"score": 0.0, "classification": "SKIP", "error": str(e)}
+            elif head == "REASON":
+                reason = tail.strip()
         
-        # Ensure we have the right number of scores
-        while len(scores) < expected_count:
-            logger.warning(f"Missing score, adding default 0.0")
-            scores.append(0.0)
+        return {
+            "score": score,
+            "classification": "RELEVANT" if score >= 0.70 else "SKIP",
+            "reason": reason
+        }
+    
+    def _parse_batch_results(self, response: str, expected_count: int,
+                             with_reasoning: bool = False) -> List[Dict]:
+        """
+        Parse batch '<idx>\t<score>[\t<reason>]' lines from Claude response.
+        
+        Results are placed by tweet number, so a skipped or garbled line only
+        loses that tweet instead of shifting every score after it.
+        
+        Args:
+            response: Raw Claude output
+            expected_count: Number of tweets in the batch
+            with_reasoning: Whether lines carry a reason column
+            
+        Returns:
+            One result per tweet; missing ones are marked with an error
+        """
+        results: List[Optional[Dict]] = [None] * expected_count
+        
+        for line in response.strip().split('\n'):
+            # Whitespace split also copes with the model using spaces for tabs
+            parts = line.split(None, 2)
+            if len(parts) < 2:
+                continue
+            try:
+                idx = int(parts[0].rstrip('.:')) - 1
+                score = max(0.0, min(1.0, float(parts[1])))  # Clamp to [0, 1]
+            except ValueError:
+                logger.warning(f"Skipping invalid result line: {line}")
+                continue
+            if not 0 <= idx < expected_count:
+                logger.warning(f"Skipping result for unknown tweet: {line}")
+                continue
+            
+            result = {"score": score, "classification": "RELEVANT" if score >= 0.70 else "SKIP"}
+            if with_reasoning:
+                result["reason"] = parts[2].strip() if len(parts) > 2 else ""
+            results[idx] = result
+        
+        # Ensure every tweet has a result
+        for i, result in enumerate(results):
+            if result is None:
+                logger.warning(f"Missing score for tweet {i + 1}, adding default 0.0")
+                results[i] = {"score": 0.0, "classification": "SKIP", "error": "Parse error"}
+                if with_reasoning:
+                    results[i]["reason"] = ""
         
-        return scores[:expected_count]
+        return results
 
 
 def process_file(input_file: Path, output_file: Path, 
                  episode_id: str = None, with_reasoning: bool = False,
-                 batch_size: int = 20) -> Dict:
+                 batch_size: int = 20, concurrency: int = 1,
+                 use_cache: bool = False) -> Dict:
     """
     Process tweets from file and save classifications.
     
@@ -283,14 +470,15 @@ def process_file(input_file: Path, output_file: Path,
         episode_id: Optional episode ID for context
         with_reasoning: Include reasoning for each classification
         batch_size: Number of tweets per batch
+        concurrency: Maximum concurrent Claude calls
+        use_cache: Reuse earlier classifications of identical tweets
         
     Returns:
         Statistics about the classification
     """
     # Load tweets
     logger.info(f"Loading tweets from {input_file}")
-    with open(input_file) as f:
-        data = json.load(f)
+    data = loads(Path(input_file).read_bytes())
     
     # Handle different input formats
     if isinstance(data, list):
@@ -301,7 +489,7 @@ def process_file(input_file: Path, output_file: Path,
         raise ValueError("Invalid input format")
     
     # Initialize classifier
-    classifier = ClaudeClassifier(episode_id)
+    classifier = ClaudeClassifier(episode_id, max_workers=concurrency, use_cache=use_cache)
     
     # Extract tweet texts
     tweet_texts = []
@@ -314,17 +502,9 @@ def process_file(input_file: Path, output_file: Path,
     # Classify tweets
     logger.info(f"Classifying {len(tweet_texts)} tweets")
     
-    if with_reasoning:
-        # Process individually for reasoning
-        results = []
-        for i, text in enumerate(tweet_texts):
-            logger.info(f"Classifying tweet {i+1}/{len(tweet_texts)}")
-            result = classifier.classify_tweet(text, with_reasoning=True)
-            result['text'] = text
-            results.append(result)
-    else:
-        # Batch process for efficiency
-        results = classifier.classify_batch(tweet_texts, batch_size)
+    # Batch process for efficiency - one CLI process per batch rather than per
+    # tweet, including when reasoning is requested
+    results = classifier.classify_batch(tweet_texts, batch_size, with_reasoning)
     
     # Add classifications back to original tweets
     for i, tweet in enumerate(tweets):
@@ -343,10 +523,14 @@ def process_file(input_file: Path, output_file: Path,
             if 'reason' in results[i]:
                 tweets[i]['classification_reason'] = results[i]['reason']
     
-    # Calculate statistics
-    relevant_count = sum(1 for r in results if r['classification'] == 'RELEVANT')
+    # Calculate statistics in a single pass over the results
+    relevant_count = 0
+    total_score = 0.0
+    for r in results:
+        relevant_count += r['classification'] == 'RELEVANT'
+        total_score += r['score']
     skip_count = len(results) - relevant_count
-    avg_score = sum(r['score'] for r in results) / len(results) if results else 0
+    avg_score = total_score / len(results) if results else 0
     
     stats = {
         'total_tweets': len(results),
@@ -365,8 +549,7 @@ def process_file(input_file: Path, output_file: Path,
     }
     
     logger.info(f"Saving results to {output_file}")
-    with open(output_file, 'w') as f:
-        json.dump(output_data, f, indent=2)
+    Path(output_file).write_bytes(dumps(output_data, indent=True))
     
     # Print summary
     logger.info(f"Classification complete:")
@@ -423,11 +606,24 @@ def main():
         default=20,
         help="Batch size for processing (default: 20)"
     )
+    parser.add_argument(
+        '--concurrency', '-c',
+        type=int,
+        default=1,
+        help="Maximum concurrent Claude calls (default: 1, i.e. sequential)"
+    )
+    parser.add_argument(
+        '--cache',
+        action='store_true',
+        help="Reuse cached results for tweets classified before"
+    )
     
     args = parser.parse_args()
     
     # Initialize classifier
-    classifier = ClaudeClassifier(args.episode_id)
+    classifier = ClaudeClassifier(
+        args.episode_id, max_workers=args.concurrency, use_cache=args.cache
+    )
     
     if args.mode == 'single':
         if not args.tweet:
@@ -459,7 +655,9 @@ def main():
             args.output,
             args.episode_id,
             args.with_reasoning,
-            args.batch_size
+            args.batch_size,
+            args.concurrency,
+            args.cache
         )
 
 
@@ -4,10 +4,11 @@ Compare Claude direct classification with few-shot based classification.
 Validates accuracy, consistency, and cost differences.
 """
 
-import json
+import hashlib
 import subprocess
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Dict, Tuple
 import argparse
@@ -16,6 +17,9 @@ from datetime import datetime
 
 # Add parent directory to path for imports
 sys.path.append(str(Path(__file__).parent.parent))
+sys.path.append(str(Path(__file__).parent.parent / "src"))
+from wdf.json_utils import dumps, loads
+
 
 # Set up logging
 logging.basicConfig(
@@ -25,19 +29,45 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 # Import the Claude classifier
-from classify import ClaudeClassifier
+from classify import ClaudeClassifier, ClassificationCache
+
+# The few-shot classifier runs in-process. Its import error is kept so that only
+# runs that actually need it (i.e. not --mock-fewshot) fail
+try:
+    import tweet_classifier
+    _tweet_classifier_error = None
+except ImportError as e:
+    tweet_classifier = None
+    _tweet_classifier_error = e
+
+# Few-shot scores keyed by model, episode, few-shots and summary + normalized tweet text
+FEWSHOT_CACHE_FILE = Path(__file__).parent / "cache" / "fewshot_cache.db"
+
+def _timed(fn, *args):
+    """Call fn(*args) and return (result, elapsed seconds)."""
+    start = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - start
+
 
 class ClassificationComparator:
     """Compare different classification methods."""
     
-    def __init__(self, episode_id: str = None):
+    def __init__(self, episode_id: str = None, use_cache: bool = False,
+                 mock_fewshot: bool = False, concurrency: int = 4):
         """Initialize comparator with episode context."""
         self.episode_id = episode_id
+        self.mock_fewshot = mock_fewshot
         self.parent_dir = Path(__file__).parent.parent
-        self.claude_classifier = ClaudeClassifier(episode_id)
+        # Claude batches for the comparison run on this many concurrent CLI calls
+        self.claude_classifier = ClaudeClassifier(
+            episode_id, max_workers=concurrency, use_cache=use_cache
+        )
+        self.fewshot_cache = ClassificationCache(FEWSHOT_CACHE_FILE) if use_cache else None
         self.results = {
             'timestamp': datetime.now().isoformat(),
             'episode_id': episode_id,
+            'fewshot_mocked': mock_fewshot,
             'comparisons': [],
             'statistics': {}
         }
@@ -47,6 +77,21 @@ class ClassificationComparator:
         Run the existing few-shot based classification.
         Uses the current pipeline's classifier.
         """
+        if self.mock_fewshot:
+            logger.warning("Using RANDOM mock few-shot scores (--mock-fewshot)")
+            import random
+            return [{
+                'text': tweet,
+                'relevance_score': random.uniform(0, 1),
+                'classification': 'RELEVANT' if random.random() > 0.5 else 'SKIP'
+            } for tweet in tweets]
+        
+        if tweet_classifier is None:
+            raise ImportError(
+                f"tweet_classifier could not be imported ({_tweet_classifier_error}); "
+                "install its dependencies or pass --mock-fewshot"
+            ) from _tweet_classifier_error
+        
         logger.info("Running few-shot classification...")
         
         # First, generate few-shots if they don't exist
@@ -56,64 +101,68 @@ class ClassificationComparator:
             self._generate_fewshots()
         
         # Load few-shots
-        with open(fewshots_path) as f:
-            fewshots = json.load(f)
+        fewshots = loads(fewshots_path.read_bytes())
         
         # Run classification using existing classifier
         results = []
-        classifier_script = self.parent_dir / "tweet_classifier.py"
         
-        if classifier_script.exists():
-            # Write tweets to temp file
-            temp_input = self.parent_dir / ".temp_tweets.txt"
-            temp_input.write_text('\n'.join(tweets))
-            
-            # Run classifier
-            cmd = [
-                sys.executable,
-                str(classifier_script),
-                "--input-file", str(temp_input),
-                "--summary-file", str(self.parent_dir / "transcripts" / "summary.md"),
-                "--workers", "1"  # Single thread for consistency
-            ]
-            
-            try:
-                result = subprocess.run(
-                    cmd,
-                    capture_output=True,
-                    text=True,
-                    cwd=self.parent_dir
+        summary_path = self.parent_dir / "transcripts" / "summary.md"
+        context_digest = self._fewshot_context_digest(fewshots, summary_path)
+        keys = [ClassificationCache.make_key(context_digest, tweet) for tweet in tweets]
+        
+        known = {}
+        if self.fewshot_cache:
+            known = {key: score for key, (score, _) in self.fewshot_cache.get_many(keys).items()}
+            if known:
+                logger.info(f"Reusing cached few-shot scores for {len(known)} tweets")
+        
+        # Only score tweets that aren't cached, and each distinct tweet only once
+        pending = {}
+        for tweet, key in zip(tweets, keys):
+            if key not in known and key not in pending:
+                pending[key] = tweet
+        
+        try:
+            if pending:
+                scores = tweet_classifier.score_tweets(
+                    list(pending.values()),
+                    summary_file=str(summary_path),
+                    workers=1,  # Single thread for consistency
+                    fewshots=fewshots
                 )
-                
-                # Parse output (classifier prints JSON)
-                if result.returncode == 0:
-                    output_lines = result.stdout.strip().split('\n')
-                    for line in output_lines:
-                        if line.startswith('{'):
-                            try:
-                                data = json.loads(line)
-                                results.append(data)
-                            except:
-                                pass
-                
-                # Clean up
-                temp_input.unlink(missing_ok=True)
-                
-            except Exception as e:
-                logger.error(f"Error running few-shot classification: {e}")
-        else:
-            logger.warning("tweet_classifier.py not found, using mock data")
-            # Mock results for testing
-            import random
-            for tweet in tweets:
+                new_entries = []
+                for key, score in zip(pending, scores):
+                    if score is None:
+                        # Failed calls count as not relevant but aren't cached
+                        known[key] = 0.0
+                    else:
+                        known[key] = score
+                        new_entries.append((key, score, None))
+                if self.fewshot_cache:
+                    self.fewshot_cache.put_many(new_entries)
+            
+            for tweet, key in zip(tweets, keys):
+                score = known[key]
                 results.append({
                     'text': tweet,
-                    'relevance_score': random.uniform(0, 1),
-                    'classification': 'RELEVANT' if random.random() > 0.5 else 'SKIP'
+                    'relevance_score': score,
+                    'classification': 'RELEVANT' if score >= 0.70 else 'SKIP'
                 })
+            
+        except Exception as e:
+            logger.error(f"Error running few-shot classification: {e}")
         
         return results
     
+    def _fewshot_context_digest(self, fewshots: List, summary_path: Path) -> str:
+        """Digest everything besides the tweet that feeds a few-shot score."""
+        h = hashlib.blake2b(tweet_classifier.DEFAULT_MODEL.encode(), digest_size=16)
+        h.update(b"\x1f" + (self.episode_id or "").encode())
+        h.update(b"\x1f" + dumps(fewshots))
+        if summary_path.exists():
+            h.update(b"\x1f" + summary_path.read_bytes())
+        return h.hexdigest()
+    
     def run_claude_classification(self, tweets: List[str]) -> List[Dict]:
         """Run Claude direct classification."""
         logger.info("Running Claude direct classification...")
@@ -134,7 +183,7 @@ class ClassificationComparator:
                 ["Check out my new NFT", "SKIP"]
             ]
             fewshots_path = self.parent_dir / "transcripts" / "fewshots.json"
-            fewshots_path.write_text(json.dumps(mock_fewshots, indent=2))
+            fewshots_path.write_bytes(dumps(mock_fewshots, indent=True))
     
     def compare_classifications(self, tweets: List[str]) -> Dict:
         """
@@ -146,42 +195,52 @@ class ClassificationComparator:
         Returns:
             Detailed comparison results
         """
-        # Run both classifiers
-        start_fewshot = time.time()
-        fewshot_results = self.run_fewshot_classification(tweets)
-        fewshot_time = time.time() - start_fewshot
-        
-        start_claude = time.time()
-        claude_results = self.claude_classifier.classify_batch(tweets)
-        claude_time = time.time() - start_claude
+        # Run both classifiers at once - each is spent waiting on a subprocess,
+        # so the comparison takes as long as the slower one rather than both
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            fewshot_future = executor.submit(_timed, self.run_fewshot_classification, tweets)
+            claude_future = executor.submit(_timed, self.run_claude_classification, tweets)
+            fewshot_results, fewshot_time = fewshot_future.result()
+            claude_results, claude_time = claude_future.result()
         
         # Analyze differences
+        # All statistics are tallied in this one pass over the tweets
         comparisons = []
-        score_diffs = []
+        total_diff = 0.0
+        max_diff = 0.0
         agreement_count = 0
+        fewshot_relevant = 0
+        claude_relevant = 0
         
-        for i, tweet in enumerate(tweets):
-            fewshot = fewshot_results[i] if i < len(fewshot_results) else {'relevance_score': 0, 'classification': 'SKIP'}
-            claude = claude_results[i] if i < len(claude_results) else {'score': 0, 'classification': 'SKIP'}
-            
+        # Pad missing results once up front instead of bounds-checking every row
+        missing_fewshot = {'relevance_score': 0, 'classification': 'SKIP'}
+        missing_claude = {'score': 0, 'classification': 'SKIP'}
+        fewshot_rows = fewshot_results + [missing_fewshot] * (len(tweets) - len(fewshot_results))
+        claude_rows = claude_results + [missing_claude] * (len(tweets) - len(claude_results))
+        
+        for tweet, fewshot, claude in zip(tweets, fewshot_rows, claude_rows):
             # Calculate difference
             fewshot_score = fewshot.get('relevance_score', 0)
             claude_score = claude.get('score', 0)
             score_diff = abs(fewshot_score - claude_score)
-            score_diffs.append(score_diff)
+            total_diff += score_diff
+            max_diff = max(max_diff, score_diff)
             
             # Check agreement
-            agrees = fewshot.get('classification') == claude.get('classification')
-            if agrees:
-                agreement_count += 1
+            fewshot_class = fewshot.get('classification')
+            claude_class = claude.get('classification')
+            agrees = fewshot_class == claude_class
+            agreement_count += agrees
+            fewshot_relevant += fewshot_class == 'RELEVANT'
+            claude_relevant += claude_class == 'RELEVANT'
             
             comparison = {
                 'tweet': tweet[:100] + '...' if len(tweet) > 100 else tweet,
                 'fewshot_score': round(fewshot_score, 3),
                 'claude_score': round(claude_score, 3),
                 'score_difference': round(score_diff, 3),
-                'fewshot_class': fewshot.get('classification'),
-                'claude_class': claude.get('classification'),
+                'fewshot_class': fewshot_class,
+                'claude_class': claude_class,
                 'agreement': agrees
             }
             comparisons.append(comparison)
@@ -189,14 +248,16 @@ class ClassificationComparator:
         # Calculate statistics
         stats = {
             'total_tweets': len(tweets),
+            # Both classifiers only send each distinct (normalized) tweet once
+            'unique_tweets': len({ClassificationCache.normalize(t) for t in tweets}),
             'agreement_rate': round(agreement_count / len(tweets) * 100, 1) if tweets else 0,
-            'average_score_difference': round(sum(score_diffs) / len(score_diffs), 3) if score_diffs else 0,
-            'max_score_difference': round(max(score_diffs), 3) if score_diffs else 0,
+            'average_score_difference': round(total_diff / len(tweets), 3) if tweets else 0,
+            'max_score_difference': round(max_diff, 3),
             'fewshot_time_seconds': round(fewshot_time, 2),
             'claude_time_seconds': round(claude_time, 2),
             'speed_ratio': round(fewshot_time / claude_time, 2) if claude_time > 0 else 0,
-            'fewshot_relevant_count': sum(1 for r in fewshot_results if r.get('classification') == 'RELEVANT'),
-            'claude_relevant_count': sum(1 for r in claude_results if r.get('classification') == 'RELEVANT')
+            'fewshot_relevant_count': fewshot_relevant,
+            'claude_relevant_count': claude_relevant
         }
         
         # Cost analysis
@@ -221,9 +282,12 @@ class ClassificationComparator:
         print("CLASSIFICATION COMPARISON REPORT")
         print("="*60)
         
+        if self.results['fewshot_mocked']:
+            print("\n⚠️ FEW-SHOT SCORES ARE RANDOM MOCK DATA (--mock-fewshot) - not a real comparison")
+        
         print(f"\nEpisode ID: {self.results['episode_id'] or 'None'}")
         print(f"Timestamp: {self.results['timestamp']}")
-        print(f"Total Tweets: {stats['total_tweets']}")
+        print(f"Total Tweets: {stats['total_tweets']} ({stats['unique_tweets']} unique)")
         
         print("\n--- ACCURACY METRICS ---")
         print(f"Agreement Rate: {stats['agreement_rate']}%")
@@ -275,31 +339,33 @@ class ClassificationComparator:
     
     def save_report(self, output_path: Path):
         """Save detailed comparison report to file."""
-        with open(output_path, 'w') as f:
-            json.dump(self.results, f, indent=2)
+        output_path.write_bytes(dumps(self.results, indent=True))
         logger.info(f"Report saved to {output_path}")
 
 
+# Built-in sample tweets for --use-samples
+SAMPLE_TWEETS = (
+    "The federal government has completely overstepped its constitutional boundaries. Time for states to push back!",
+    "Just finished my morning coffee ☕",
+    "State sovereignty isn't just a concept, it's our last hope against tyranny",
+    "Anyone know a good pizza place in Austin?",
+    "The 10th Amendment has been ignored for too long. States need to reclaim their rights.",
+    "Watching the game tonight! Go team!",
+    "Federal mandates are destroying small businesses. Let states decide their own policies.",
+    "My cat is being adorable right now 😺",
+    "If we don't embrace federalism soon, we're headed for civil conflict",
+    "Check out my new NFT collection! Link in bio",
+    "The founding fathers would be appalled at federal overreach",
+    "Recipe for chocolate chip cookies: First, preheat oven to 350°F...",
+    "State nullification is a legitimate constitutional remedy",
+    "Weather is perfect today for a bike ride!",
+    "Time for a national divorce? Maybe peaceful separation is the answer.",
+)
+
+
 def load_sample_tweets() -> List[str]:
     """Load sample tweets for testing."""
-    samples = [
-        "The federal government has completely overstepped its constitutional boundaries. Time for states to push back!",
-        "Just finished my morning coffee ☕",
-        "State sovereignty isn't just a concept, it's our last hope against tyranny",
-        "Anyone know a good pizza place in Austin?",
-        "The 10th Amendment has been ignored for too long. States need to reclaim their rights.",
-        "Watching the game tonight! Go team!",
-        "Federal mandates are destroying small businesses. Let states decide their own policies.",
-        "My cat is being adorable right now 😺",
-        "If we don't embrace federalism soon, we're headed for civil conflict",
-        "Check out my new NFT collection! Link in bio",
-        "The founding fathers would be appalled at federal overreach",
-        "Recipe for chocolate chip cookies: First, preheat oven to 350°F...",
-        "State nullification is a legitimate constitutional remedy",
-        "Weather is perfect today for a bike ride!",
-        "Time for a national divorce? Maybe peaceful separation is the answer.",
-    ]
-    return samples
+    return list(SAMPLE_TWEETS)
 
 
 def main():
@@ -327,6 +393,22 @@ def main():
         action='store_true',
         help="Use built-in sample tweets for testing"
     )
+    parser.add_argument(
+        '--cache',
+        action='store_true',
+        help="Reuse cached results for tweets classified before"
+    )
+    parser.add_argument(
+        '--concurrency', '-c',
+        type=int,
+        default=4,
+        help="Maximum concurrent Claude calls (default: 4)"
+    )
+    parser.add_argument(
+        '--mock-fewshot',
+        action='store_true',
+        help="Use random few-shot scores instead of tweet_classifier (for testing only)"
+    )
     
     args = parser.parse_args()
     
@@ -335,12 +417,11 @@ def main():
         tweets = load_sample_tweets()
         logger.info(f"Using {len(tweets)} sample tweets")
     elif args.input:
-        with open(args.input) as f:
-            data = json.load(f)
-            if isinstance(data, list):
-                tweets = [t if isinstance(t, str) else t.get('text', '') for t in data]
-            else:
-                tweets = [t.get('text', '') for t in data.get('tweets', [])]
+        data = loads(args.input.read_bytes())
+        if isinstance(data, list):
+            tweets = [t if isinstance(t, str) else t.get('text', '') for t in data]
+        else:
+            tweets = [t.get('text', '') for t in data.get('tweets', [])]
         logger.info(f"Loaded {len(tweets)} tweets from {args.input}")
     else:
         print("Enter tweets to compare (one per line, empty line to finish):")
@@ -356,7 +437,10 @@ def main():
         return
     
     # Run comparison
-    comparator = ClassificationComparator(args.episode_id)
+    comparator = ClassificationComparator(
+        args.episode_id, use_cache=args.cache, mock_fewshot=args.mock_fewshot,
+        concurrency=args.concurrency
+    )
     results = comparator.compare_classifications(tweets)
     
     # Print report
@@ -5,15 +5,20 @@ Reduces API calls by caching and matching similar prompts
 """
 
 import hashlib
-import json
+import sys
 import time
 from pathlib import Path
 from typing import Optional, Dict, List
 import logging
 from datetime import datetime, timedelta
 
+# Shared JSON helpers from the wdf package
+sys.path.append(str(Path(__file__).parent.parent.parent / "src"))
+from wdf.json_utils import dumps, loads
+
 logger = logging.getLogger(__name__)
 
+
 class ResponseCache:
     """
     Smart caching with similarity matching and TTL.
@@ -46,8 +51,7 @@ class ResponseCache:
         """Load cache from disk."""
         if self.cache_file.exists():
             try:
-                with open(self.cache_file) as f:
-                    return json.load(f)
+                return loads(self.cache_file.read_bytes())
             except Exception as e:
                 logger.error(f"Failed to load cache: {e}")
         return {}
@@ -55,15 +59,17 @@ class ResponseCache:
     def _save_cache(self):
         """Save cache to disk."""
         try:
-            with open(self.cache_file, 'w') as f:
-                json.dump(self.cache, f, indent=2)
+            self.cache_file.write_bytes(dumps(self.cache, indent=True))
         except Exception as e:
             logger.error(f"Failed to save cache: {e}")
     
     def _hash_key(self, prompt: str, mode: str) -> str:
         """Generate cache key from prompt and mode."""
-        combined = f"{mode}:{prompt}"
-        return hashlib.md5(combined.encode()).hexdigest()
+        # blake2b is faster than md5 here and hashing the parts avoids copying the prompt
+        h = hashlib.blake2b(mode.encode(), digest_size=16)
+        h.update(b"\x1f")
+        h.update(prompt.encode())
+        return h.hexdigest()
     
     def _is_expired(self, timestamp: float) -> bool:
         """Check if cache entry is expired."""
@@ -202,7 +208,7 @@ class ResponseCache:
         hit_rate = self.stats['hits'] / total_requests if total_requests > 0 else 0
         
         # Calculate cache size
-        cache_size = len(json.dumps(self.cache))
+        cache_size = len(dumps(self.cache))
         
         return {
             'total_entries': len(self.cache),
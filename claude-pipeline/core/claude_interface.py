@@ -148,9 +148,9 @@ class ClaudeInterface:
         full_prompt = self._prepare_prompt(prompt, mode)
         
         # Call Claude CLI with mode for specialized context
-        start_time = time.time()
+        start_time = time.perf_counter()
         response = self._call_claude_cli(full_prompt, mode, temperature)
-        elapsed = time.time() - start_time
+        elapsed = time.perf_counter() - start_time
         
         logger.info(f"Claude {mode} call took {elapsed:.2f}s")
         
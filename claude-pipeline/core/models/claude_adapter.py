@@ -16,6 +16,7 @@ Features:
 
 import asyncio
 import logging
+import re
 import subprocess
 import time
 from pathlib import Path
@@ -75,6 +76,19 @@ class ClaudeAdapter(ModelInterface):
         
         self.cli_model = self._get_cli_model_name()
         
+        # The CLI path, MCP config and model are fixed for the adapter's lifetime,
+        # so build the static part of the command and resolve stage dirs only once
+        mcp_config_path = self.pipeline_dir / "minimal-mcp-config.json"
+        self._base_cmd = [
+            self.claude_cli,
+            "--strict-mcp-config",  # Prevent loading user's MCP config
+            "--mcp-config", str(mcp_config_path),  # Use our minimal config
+            "--dangerously-skip-permissions",  # Skip permission prompts for @ references
+            "--model", self.cli_model,
+            "--print"
+        ]
+        self._stage_dirs: Dict[str, Path] = {}
+        
         logger.info(f"Claude adapter initialized: {self.model_name} -> {self.cli_model}")
     
     def _get_cli_model_name(self) -> str:
@@ -96,7 +110,7 @@ class ClaudeAdapter(ModelInterface):
         Returns:
             ModelResponse with generated content
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         try:
             # For summarize and respond modes, don't add MODE: prefix - the specialized CLAUDE.md handles it
@@ -110,7 +124,7 @@ class ClaudeAdapter(ModelInterface):
             response_text = await self._call_claude_cli(prepared_prompt, context, mode)
             
             # Calculate metrics
-            latency_ms = int((time.time() - start_time) * 1000)
+            latency_ms = int((time.perf_counter() - start_time) * 1000)
             input_tokens = len(prepared_prompt) // 4  # Rough estimate
             output_tokens = len(response_text) // 4  # Rough estimate
             cost = self.estimate_cost(input_tokens, output_tokens)
@@ -247,7 +261,6 @@ class ClaudeAdapter(ModelInterface):
             if mode == "summarize":
                 # For summarize mode, we expect the prompt to contain a path to the transcript file
                 # Look for @/path/to/transcript.txt pattern in the prompt
-                import re
                 transcript_path_match = re.search(r'@([^\s]+transcript\.txt)', prompt)
                 
                 if transcript_path_match:
@@ -298,34 +311,14 @@ Summarize this transcript: @{temp_transcript}"""
                 temp_prompt.write_text(prompt)
                 logger.info(f"Created temp prompt file: {temp_prompt} ({len(prompt)} chars)")
             
-            # Build Claude CLI command with MCP config to prevent MCP usage
-            # Use minimal MCP config file to avoid any MCP server connections
-            mcp_config_path = self.pipeline_dir / "minimal-mcp-config.json"
-            
             # For respond mode, pass prompt via stdin to avoid file analysis
             if mode == 'respond':
-                cmd = [
-                    self.claude_cli,
-                    "--strict-mcp-config",  # Prevent loading user's MCP config
-                    "--mcp-config", str(mcp_config_path),  # Use our minimal config
-                    "--dangerously-skip-permissions",  # Skip permission prompts for @ references
-                    "--model", self.cli_model,
-                    "--print"
-                    # No file reference - will pass via stdin
-                ]
+                cmd = list(self._base_cmd)  # No file reference - will pass via stdin
                 use_stdin = True
                 stdin_content = prompt  # Use the prompt directly
             else:
                 # For other modes, use file reference
-                cmd = [
-                    self.claude_cli,
-                    "--strict-mcp-config",  # Prevent loading user's MCP config
-                    "--mcp-config", str(mcp_config_path),  # Use our minimal config
-                    "--dangerously-skip-permissions",  # Skip permission prompts for @ references
-                    "--model", self.cli_model,
-                    "--print",
-                    f"@{temp_prompt}"  # Use @ prefix to indicate file reference
-                ]
+                cmd = [*self._base_cmd, f"@{temp_prompt}"]  # Use @ prefix to indicate file reference
                 use_stdin = False
                 stdin_content = None
             
@@ -475,6 +468,10 @@ Summarize this transcript: @{temp_transcript}"""
         Returns:
             Path to the specialized stage directory or pipeline directory as fallback
         """
+        cached = self._stage_dirs.get(mode)
+        if cached is not None:
+            return cached
+        
         mode_to_dir = {
             'summarize': 'summarizer',
             'classify': 'classifier',
@@ -485,9 +482,11 @@ Summarize this transcript: @{temp_transcript}"""
         if mode in mode_to_dir:
             specialized_dir = self.pipeline_dir / "specialized" / mode_to_dir[mode]
             if specialized_dir.exists():
+                self._stage_dirs[mode] = specialized_dir
                 return specialized_dir
         
         # Fallback to pipeline directory
+        self._stage_dirs[mode] = self.pipeline_dir
         return self.pipeline_dir
     
     def _get_specialized_context_file(self, mode: str) -> Optional[Path]:
@@ -107,7 +107,7 @@ class OllamaAdapter(ModelInterface):
         Returns:
             ModelResponse with generated content
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         try:
             # Prepare the full prompt with context and mode
@@ -120,7 +120,7 @@ class OllamaAdapter(ModelInterface):
             response_text = response_data.get('response', '').strip()
             
             # Calculate metrics
-            latency_ms = int((time.time() - start_time) * 1000)
+            latency_ms = int((time.perf_counter() - start_time) * 1000)
             
             # Get token counts from Ollama response or estimate
             input_tokens = response_data.get('prompt_eval_count', len(full_prompt) // 4)
@@ -135,9 +135,9 @@ class UnifiedInterface:
                 model.config.temperature = temperature
             
             # Call the model
-            start_time = time.time()
+            start_time = time.perf_counter()
             response = await model.generate(prompt, adapted_context, mode)
-            elapsed = time.time() - start_time
+            elapsed = time.perf_counter() - start_time
             
             logger.info(f"{model.model_name} {mode} call took {elapsed:.2f}s")
             
@@ -296,9 +296,6 @@ class UnifiedInterface:
             all_results = []
             
             # Save cleaned tweets to file for Claude CLI to reference
-            import json
-            import tempfile
-            
             # Convert tweets to proper format if needed
             tweet_data = []
             for tweet in tweets:
@@ -325,7 +322,6 @@ class UnifiedInterface:
             
             # If no episode directory, create a temp file in current working directory
             if not tweets_file:
-                import time
                 tweets_file = Path(f"temp_tweets_classify_{int(time.time())}.json")
                 with open(tweets_file, 'w') as f:
                     json.dump(tweet_data, f, indent=2)
@@ -4,6 +4,7 @@ Master Pipeline Orchestrator - Runs the complete unified Claude pipeline
 Each episode gets its own directory with CLAUDE.md as the memory
 """
 
+import io
 import json
 import logging
 import os
@@ -31,6 +32,9 @@ logger = logging.getLogger(__name__)
 # Rich console for pretty output
 console = Console()
 
+# Tweet syncs at or above this size go through COPY into a staging table
+TWEET_COPY_THRESHOLD = 500
+
 class UnifiedClaudePipeline:
     """
     Master orchestrator for the unified Claude pipeline.
@@ -702,53 +706,63 @@ class UnifiedClaudePipeline:
             project_root = Path(__file__).parent.parent
             sys.path.insert(0, str(project_root / "web" / "scripts"))
             
+            from psycopg2.extras import execute_values
             from web_bridge import WebUIBridge
-            bridge = WebUIBridge()
-            
-            # First need to ensure tweets are associated with the episode
-            # Get the episode's database ID
-            episode_dir = self.episode_mgr.get_episode_dir(episode_id)
+            # The with-block returns the pooled connection even if the sync fails
+            with WebUIBridge() as bridge:
+                # First need to ensure tweets are associated with the episode
+                # Get the episode's database ID
+                episode_dir = self.episode_mgr.get_episode_dir(episode_id)
             
-            with bridge.connection.cursor() as cursor:
-                # Find the episode in database
-                cursor.execute("""
-                    SELECT id FROM podcast_episodes 
-                    WHERE claude_episode_dir = %s OR episode_dir = %s
-                """, (episode_id, episode_id))
-                result = cursor.fetchone()
+                with bridge.connection.cursor() as cursor:
+                    # Find the episode in database
+                    cursor.execute("""
+                        SELECT id FROM podcast_episodes 
+                        WHERE claude_episode_dir = %s OR episode_dir = %s
+                    """, (episode_id, episode_id))
+                    result = cursor.fetchone()
                 
-                if result:
-                    db_episode_id = result[0]
+                    if result:
+                        db_episode_id = result[0]
                     
-                    # Insert tweets if they don't exist
-                    for tweet in tweets:
-                        cursor.execute("""
-                            INSERT INTO tweets (
-                                twitter_id, author_handle, full_text, text_preview,
-                                created_at, updated_at, status, episode_id
-                            ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-                            ON CONFLICT (twitter_id) 
-                            DO UPDATE SET 
-                                episode_id = EXCLUDED.episode_id,
-                                updated_at = CURRENT_TIMESTAMP
-                        """, (
-                            tweet.get('id', tweet.get('twitter_id')),
-                            tweet.get('user', '@unknown'),
-                            tweet.get('text', ''),
-                            tweet.get('text', '')[:280],
-                            tweet.get('created_at', datetime.now()),
-                            datetime.now(),  # updated_at
-                            'unclassified',
-                            db_episode_id
-                        ))
+                        # Insert tweets if they don't exist, in one multi-row statement
+                        # per page instead of one round-trip per tweet. Rows are keyed by
+                        # twitter_id so a duplicate in the batch can't hit ON CONFLICT twice.
+                        now = datetime.now()
+                        rows = {}
+                        for tweet in tweets:
+                            twitter_id = tweet.get('id', tweet.get('twitter_id'))
+                            rows[twitter_id] = (
+                                twitter_id,
+                                tweet.get('user', '@unknown'),
+                                tweet.get('text', ''),
+                                tweet.get('text', '')[:280],
+                                tweet.get('created_at', now),
+                                'unclassified',
+                                db_episode_id
+                            )
                     
-                    bridge.connection.commit()
-                    logger.info(f"Synced {len(tweets)} tweets to database for episode {episode_id} (DB ID: {db_episode_id})")
-                    console.print(f"[dim]Synced {len(tweets)} tweets to database[/dim]")
-                else:
-                    logger.warning(f"Episode {episode_id} not found in database - cannot sync tweets")
-            
-            bridge.close()
+                        if len(rows) >= TWEET_COPY_THRESHOLD:
+                            self._copy_tweets_to_database(cursor, list(rows.values()))
+                        else:
+                            execute_values(cursor, """
+                                INSERT INTO tweets (
+                                    twitter_id, author_handle, full_text, text_preview,
+                                    created_at, updated_at, status, episode_id
+                                ) VALUES %s
+                                ON CONFLICT (twitter_id) 
+                                DO UPDATE SET 
+                                    episode_id = EXCLUDED.episode_id,
+                                    updated_at = CURRENT_TIMESTAMP
+                            """, list(rows.values()),
+                                template="(%s, %s, %s, %s, %s, CURRENT_TIMESTAMP, %s, %s)",
+                                page_size=500)
+                    
+                        bridge.connection.commit()
+                        logger.info(f"Synced {len(rows)} tweets to database for episode {episode_id} (DB ID: {db_episode_id})")
+                        console.print(f"[dim]Synced {len(rows)} tweets to database[/dim]")
+                    else:
+                        logger.warning(f"Episode {episode_id} not found in database - cannot sync tweets")
             
         except ImportError:
             logger.debug("WebUIBridge not available - running in file-only mode")
@@ -756,6 +770,59 @@ class UnifiedClaudePipeline:
             logger.warning(f"Failed to sync tweets to database: {e}")
             # Continue anyway - don't fail the pipeline
     
+    def _copy_tweets_to_database(self, cursor, rows: List[tuple]):
+        """
+        Upsert a large tweet batch by streaming it into a temp table with COPY.
+        
+        Args:
+            cursor: Open cursor on the bridge connection (caller commits)
+            rows: Tweet tuples in the staging column order
+        """
+        def copy_field(value) -> str:
+            if value is None:
+                return '\\N'
+            return (str(value).replace('\\', '\\\\')
+                    .replace('\t', '\\t')
+                    .replace('\n', '\\n')
+                    .replace('\r', '\\r'))
+        
+        buf = io.StringIO()
+        for row in rows:
+            buf.write('\t'.join(copy_field(value) for value in row))
+            buf.write('\n')
+        buf.seek(0)
+        
+        cursor.execute("""
+            CREATE TEMP TABLE _tweets_stage (
+                twitter_id VARCHAR(50),
+                author_handle VARCHAR(100),
+                full_text TEXT,
+                text_preview VARCHAR(280),
+                created_at TIMESTAMP(3),
+                status VARCHAR(20),
+                episode_id INTEGER
+            ) ON COMMIT DROP
+        """)
+        cursor.copy_expert("""
+            COPY _tweets_stage (
+                twitter_id, author_handle, full_text, text_preview,
+                created_at, status, episode_id
+            ) FROM STDIN WITH (FORMAT text)
+        """, buf)
+        cursor.execute("""
+            INSERT INTO tweets (
+                twitter_id, author_handle, full_text, text_preview,
+                created_at, updated_at, status, episode_id
+            )
+            SELECT twitter_id, author_handle, full_text, text_preview,
+                   created_at, CURRENT_TIMESTAMP, status, episode_id
+            FROM _tweets_stage
+            ON CONFLICT (twitter_id) 
+            DO UPDATE SET 
+                episode_id = EXCLUDED.episode_id,
+                updated_at = CURRENT_TIMESTAMP
+        """)
+    
     def _get_default_overview(self) -> str:
         """Get default podcast overview."""
         return """The War, Divorce, or Federalism podcast explores America's political future 
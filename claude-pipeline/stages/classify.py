@@ -3,6 +3,7 @@
 Classification stage - Direct tweet classification without few-shots
 """
 
+import json
 import logging
 import asyncio
 import os
@@ -65,8 +66,6 @@ class Classifier:
         logger.info(f"Cleaned tweets from avg {sum(len(str(t)) for t in tweets)/len(tweets):.0f} to {sum(len(str(t)) for t in cleaned_tweets)/len(cleaned_tweets):.0f} chars each")
         
         # Save cleaned tweets to episode directory for reference
-        from pathlib import Path
-        import json
         from core.episode_manager import EpisodeManager
         
         # Use EpisodeManager to get the correct episode directory
@@ -140,9 +139,8 @@ class Classifier:
         # Sync classifications to database if web bridge is available
         if HAS_WEB_BRIDGE and os.getenv("WDF_WEB_MODE") == "true":
             try:
-                bridge = WebUIBridge()
-                bridge.notify_tweets_classified(tweets)
-                bridge.close()
+                with WebUIBridge() as bridge:
+                    bridge.notify_tweets_classified(tweets)
                 logger.info(f"Synced {len(tweets)} tweet classifications to database")
             except Exception as e:
                 logger.warning(f"Failed to sync classifications to database: {e}")
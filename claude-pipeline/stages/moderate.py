@@ -5,6 +5,7 @@ Quality moderation stage - Claude evaluates its own responses for quality
 
 import logging
 import json
+import re
 from pathlib import Path
 from typing import Dict, List
 
@@ -135,7 +136,6 @@ class QualityModerator:
         evaluation['has_url'] = has_url
         
         # Check for emojis
-        import re
         emoji_pattern = re.compile("["
             u"\U0001F600-\U0001F64F"
             u"\U0001F300-\U0001F5FF"
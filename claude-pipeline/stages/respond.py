@@ -6,6 +6,7 @@ Response generation stage - Creates engaging tweet responses using episode conte
 import logging
 import json
 import os
+import re
 import sys
 from pathlib import Path
 from typing import Dict, List
@@ -42,7 +43,6 @@ class ResponseGenerator:
         self.claude = claude
         self.batch_processor = BatchProcessor(max_workers=3)
         # Use same episodes directory as orchestrator
-        from pathlib import Path
         episodes_dir = Path(__file__).parent.parent / "episodes"
         self.episode_mgr = EpisodeManager(episodes_dir=str(episodes_dir))
         logger.info("Response generator initialized")
@@ -162,7 +162,6 @@ Generate a response:"""
                     break
         
         # Remove emojis if any slipped through
-        import re
         emoji_pattern = re.compile("["
             u"\U0001F600-\U0001F64F"  # emoticons
             u"\U0001F300-\U0001F5FF"  # symbols & pictographs
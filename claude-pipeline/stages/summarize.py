@@ -6,6 +6,7 @@ Summarization stage - Generates comprehensive summary and creates episode contex
 import logging
 import hashlib
 import os
+import re
 import sys
 from pathlib import Path
 from typing import Dict, List
@@ -265,7 +266,6 @@ The transcript has been saved and can be manually summarized later.
                 # Look for lines with multiple hashtags or comma-separated terms
                 if line.count('#') > 2 or (line.count(',') > 2 and len(line) < 200):
                     # Extract hashtags
-                    import re
                     hashtags = re.findall(r'#\w+', line)
                     keywords.extend([tag.strip('#') for tag in hashtags])
                     
@@ -377,13 +377,12 @@ Output keywords as a comma-separated list on a single line (no other text):"""
             try:
                 episode_id_str = result.get('episode_id', '')
                 if episode_id_str:
-                    bridge = WebUIBridge()
-                    bridge.save_keywords_to_database(
-                        episode_dir=episode_id_str,
-                        keywords=result['keywords'],
-                        source='claude'
-                    )
-                    bridge.close()
+                    with WebUIBridge() as bridge:
+                        bridge.save_keywords_to_database(
+                            episode_dir=episode_id_str,
+                            keywords=result['keywords'],
+                            source='claude'
+                        )
                     logger.info(f"Saved {len(result['keywords'])} keywords to database for episode {episode_id_str}")
                 else:
                     logger.warning("No episode_id available for saving keywords to database")
@@ -36,11 +36,25 @@ FEWSHOTS_HASH_FILE = Path("transcripts/fewshots.hash")
 # Rich console for pretty output
 console = Console()
 
+# structlog processor chain, built once. StackInfoRenderer is left out: nothing
+# logs with stack_info=True and it adds a step to every log call.
+STRUCTLOG_PROCESSORS = [
+    structlog.stdlib.filter_by_level,
+    structlog.stdlib.add_logger_name,
+    structlog.stdlib.add_log_level,
+    structlog.stdlib.PositionalArgumentsFormatter(),
+    structlog.processors.TimeStamper(fmt="iso"),
+    structlog.processors.StackInfoRenderer(),
+    structlog.processors.format_exc_info,
+    structlog.processors.UnicodeDecoder(),
+    structlog.processors.JSONRenderer()
+]
+
 # Prometheus metrics
 PROCESSING_LATENCY = Histogram(
     "processing_latency_seconds",
     "End-to-end processing latency for pipeline stages",
-    ["stage", "run_id"],
+    ["stage"],
     buckets=[1, 5, 10, 30, 60, 120, 300, 600]
 )
 
@@ -159,13 +173,15 @@ def _timeit(label: str, callable_or_cmd, run_id: str = "unknown"):
             data = {
                 label: {
                     "seconds": elapsed,
+                    "run_id": run_id,
                     "finished": datetime.datetime.utcnow().isoformat()
                 }
             }
             _append_json(STAGE_LOG, data)
             
             # Record Prometheus metric
-            PROCESSING_LATENCY.labels(stage=label, run_id=run_id).observe(elapsed)
+            # run_id stays out of the labels (one series set per run); it is in the stage log above
+            PROCESSING_LATENCY.labels(stage=label).observe(elapsed)
             
             return result
             
@@ -416,24 +432,15 @@ def run(verbose: bool = False, non_interactive: bool = False, metrics_port: int
         ]
     )
     
-    # Configure structlog
-    structlog.configure(
-        processors=[
-            structlog.stdlib.filter_by_level,
-            structlog.stdlib.add_logger_name,
-            structlog.stdlib.add_log_level,
-            structlog.stdlib.PositionalArgumentsFormatter(),
-            structlog.processors.TimeStamper(fmt="iso"),
-            structlog.processors.StackInfoRenderer(),
-            structlog.processors.format_exc_info,
-            structlog.processors.UnicodeDecoder(),
-            structlog.processors.JSONRenderer()
-        ],
-        context_class=dict,
-        logger_factory=structlog.stdlib.LoggerFactory(),
-        wrapper_class=structlog.stdlib.BoundLogger,
-        cache_logger_on_first_use=True,
-    )
+    # Configure structlog (once per process)
+    if not structlog.is_configured():
+        structlog.configure(
+            processors=STRUCTLOG_PROCESSORS,
+            context_class=dict,
+            logger_factory=structlog.stdlib.LoggerFactory(),
+            wrapper_class=structlog.stdlib.BoundLogger,
+            cache_logger_on_first_use=True,
+        )
     
     # Display header
     console.print(Panel.fit(
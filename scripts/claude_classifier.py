@@ -124,7 +124,7 @@ def classify_tweets_batch(tweets: List[str], summary: str, examples: List[Tuple[
 def main():
     """Main entry point"""
     parser = argparse.ArgumentParser(description="Classify tweets using Claude")
-    parser.add_argument("--input-file", type=str, required=True, help="Input file with tweets")
+    parser.add_argument("--input-file", type=str, required=True, help="Input file with tweets ('-' for stdin)")
     parser.add_argument("--summary-file", type=str, help="Podcast summary file")
     parser.add_argument("--output-file", type=str, help="Output file for results")
     parser.add_argument("--workers", type=int, default=1, help="Number of workers (ignored for Claude)")
@@ -133,7 +133,7 @@ def main():
     
     # Load tweets
     tweets = []
-    with open(args.input_file, 'r') as f:
+    with (sys.stdin if args.input_file == "-" else open(args.input_file, 'r')) as f:
         for line in f:
             line = line.strip()
             if line:
@@ -0,0 +1,81 @@
+"""
+Shared PostgreSQL connection pools
+
+One psycopg2 ThreadedConnectionPool per DSN for the whole process, used by the
+web bridge and the Claude pipeline's model factory so they don't each open
+their own connections.
+"""
+
+import atexit
+import os
+import threading
+from contextlib import contextmanager
+from typing import Dict, Iterator
+
+from psycopg2.pool import ThreadedConnectionPool
+
+_pools: Dict[str, ThreadedConnectionPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_db_pool(db_url: str) -> ThreadedConnectionPool:
+    """
+    Get the connection pool for a database URL, creating it on first use
+
+    Args:
+        db_url: psycopg2 DSN (without Prisma query parameters)
+
+    Returns:
+        Process-wide ThreadedConnectionPool for that DSN
+    """
+    pool = _pools.get(db_url)
+    if pool is None:
+        with _pools_lock:
+            pool = _pools.get(db_url)
+            if pool is None:
+                pool = ThreadedConnectionPool(
+                    minconn=1,
+                    maxconn=int(os.getenv("WDF_DB_POOL_SIZE", "8")),
+                    dsn=db_url
+                )
+                _pools[db_url] = pool
+    return pool
+
+
+def release_connection(db_url: str, conn) -> None:
+    """
+    Return a connection to its pool
+
+    The pool rolls back any open transaction, so a read-only caller doesn't
+    leave the connection idle in transaction; dead connections are discarded.
+
+    Args:
+        db_url: DSN the connection was checked out for
+        conn: Connection from get_db_pool(db_url).getconn()
+    """
+    get_db_pool(db_url).putconn(conn, close=bool(conn.closed))
+
+
+@contextmanager
+def pooled_connection(db_url: str) -> Iterator:
+    """
+    Check a connection out of the pool for the duration of a with-block
+
+    Args:
+        db_url: psycopg2 DSN
+
+    Yields:
+        psycopg2 connection (uncommitted work is rolled back on release)
+    """
+    conn = get_db_pool(db_url).getconn()
+    try:
+        yield conn
+    finally:
+        release_connection(db_url, conn)
+
+
+@atexit.register
+def close_all_pools() -> None:
+    """Close all pooled connections at interpreter exit"""
+    for pool in _pools.values():
+        pool.closeall()
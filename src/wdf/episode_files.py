@@ -167,8 +167,9 @@ class EpisodeFileManager:
             # Try web bridge first
             try:
                 from web.scripts.web_bridge import WebUIBridge
-                bridge = WebUIBridge()
-                episode = bridge.get_episode(int(self.episode_id))
+                # Closing the bridge returns its pooled connection
+                with WebUIBridge() as bridge:
+                    episode = bridge.get_episode(int(self.episode_id))
                 if episode:
                     # Map database fields to our expected format
                     result = {
@@ -0,0 +1,55 @@
+"""
+JSON encoding helpers shared by the pipeline scripts
+
+Uses orjson when it is installed (the optional "fast-json" extra) and falls back
+to the stdlib json module otherwise. Both paths work on bytes and produce the
+same JSON, so files written by one can be read by the other.
+"""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dumps(obj: Any, indent: bool = False) -> bytes:
+    """
+    Encode an object as JSON bytes
+
+    Non-string dict keys are converted to strings, as json.dumps does.
+
+    Args:
+        obj: Object to encode
+        indent: Indent by two spaces, for files meant to be read by hand
+
+    Returns:
+        UTF-8 encoded JSON
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(obj, option=option)
+    if indent:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode()
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode()
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """
+    Decode JSON from bytes or a string
+
+    Args:
+        data: JSON document
+
+    Returns:
+        Decoded object
+
+    Raises:
+        json.JSONDecodeError: If the document is not valid JSON (orjson's error
+            type subclasses it)
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -450,9 +450,10 @@ class KeywordLearner:
                 logger.info(f"Reset learned weight for '{keyword}'")
         else:
             self.learned_weights = {}
-            # Clear all Redis keys
-            for key in self.redis.scan_iter(match="keywords:learned:*"):
-                self.redis.delete(key)
+            # Clear all Redis keys with a single DEL
+            keys = list(self.redis.scan_iter(match="keywords:learned:*", count=500))
+            if keys:
+                self.redis.delete(*keys)
             logger.info("Reset all learned keyword weights")
         
         self._save_learned_weights()
\ No newline at end of file
@@ -13,6 +13,7 @@ from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 from collections import defaultdict
+from functools import lru_cache
 import redis
 from prometheus_client import Counter, Gauge, Histogram
 
@@ -39,6 +40,16 @@ KEYWORD_EFFECTIVENESS = Gauge(
 )
 
 
+@lru_cache(maxsize=4096)
+def _keyword_metrics(keyword: str) -> Tuple:
+    """Bind the per-keyword metric children once instead of on every observation."""
+    return (
+        KEYWORD_HITS.labels(keyword=keyword),
+        KEYWORD_RELEVANCE.labels(keyword=keyword),
+        KEYWORD_EFFECTIVENESS.labels(keyword=keyword),
+    )
+
+
 class KeywordTracker:
     """
     Tracks keyword performance and effectiveness.
@@ -65,6 +76,8 @@ class KeywordTracker:
         self.hits_key = "keywords:hits:{keyword}"
         self.relevance_key = "keywords:relevance:{keyword}"
         self.history_key = "keywords:history:{keyword}:{date}"
+        # Set of every keyword with a hits counter, so listing them needs no SCAN
+        self.tracked_key = "keywords:tracked"
         
         # Load historical data
         self._load_tracking_data()
@@ -81,6 +94,7 @@ class KeywordTracker:
                     hits_key = self.hits_key.format(keyword=keyword)
                     if not self.redis.exists(hits_key):
                         self.redis.set(hits_key, stats.get('hits', 0))
+                        self.redis.sadd(self.tracked_key, keyword)
                         
                         # Store relevance scores
                         rel_key = self.relevance_key.format(keyword=keyword)
@@ -92,6 +106,20 @@ class KeywordTracker:
         except Exception as e:
             logger.error(f"Failed to load tracking data: {e}")
     
+    def _ensure_tracked_index(self):
+        """Backfill the tracked-keyword set once from hit counters written before it existed."""
+        backfilled_key = f"{self.tracked_key}:backfilled"
+        if self.redis.exists(backfilled_key):
+            return
+        prefix = self.hits_key.format(keyword='')
+        keywords = [
+            (key.decode('utf-8') if isinstance(key, bytes) else key)[len(prefix):]
+            for key in self.redis.scan_iter(match=self.hits_key.format(keyword='*'), count=500)
+        ]
+        if keywords:
+            self.redis.sadd(self.tracked_key, *keywords)
+        self.redis.set(backfilled_key, 1)
+    
     def record_keyword_match(self, keyword: str, relevance_score: float, 
                            tweet_id: str = None, tweet_text: str = None):
         """
@@ -103,33 +131,36 @@ class KeywordTracker:
             tweet_id: Optional tweet ID
             tweet_text: Optional tweet text for analysis
         """
-        # Update hit count
         hits_key = self.hits_key.format(keyword=keyword)
-        self.redis.incr(hits_key)
-        
-        # Track relevance score
         rel_key = self.relevance_key.format(keyword=keyword)
-        self.redis.lpush(rel_key, relevance_score)
-        self.redis.ltrim(rel_key, 0, 999)  # Keep last 1000 scores
         
-        # Record daily history
-        today = datetime.utcnow().strftime('%Y-%m-%d')
-        history_key = self.history_key.format(keyword=keyword, date=today)
+        # Build the daily history entry before touching Redis
+        now = datetime.utcnow()
+        history_key = self.history_key.format(keyword=keyword, date=now.strftime('%Y-%m-%d'))
         
         history_data = {
             'hits': 1,
             'relevance': relevance_score,
-            'timestamp': datetime.utcnow().isoformat()
+            'timestamp': now.isoformat()
         }
         if tweet_id:
             history_data['tweet_id'] = tweet_id
-            
-        self.redis.lpush(history_key, json.dumps(history_data))
-        self.redis.expire(history_key, 86400 * 30)  # Keep for 30 days
+        history_entry = json.dumps(history_data)
+        
+        # Hit count, index, relevance scores and history in one round-trip
+        pipe = self.redis.pipeline(transaction=False)
+        pipe.incr(hits_key)
+        pipe.sadd(self.tracked_key, keyword)
+        pipe.lpush(rel_key, relevance_score)
+        pipe.ltrim(rel_key, 0, 999)  # Keep last 1000 scores
+        pipe.lpush(history_key, history_entry)
+        pipe.expire(history_key, 86400 * 30)  # Keep for 30 days
+        pipe.execute()
         
         # Update Prometheus metrics
-        KEYWORD_HITS.labels(keyword=keyword).inc()
-        KEYWORD_RELEVANCE.labels(keyword=keyword).observe(relevance_score)
+        hits_metric, relevance_metric, _ = _keyword_metrics(keyword)
+        hits_metric.inc()
+        relevance_metric.observe(relevance_score)
         
         logger.debug(
             f"Recorded match for '{keyword}': "
@@ -182,7 +213,7 @@ class KeywordTracker:
         self.redis.ltrim(eff_key, 0, 999)  # Keep last 1000
         
         # Update Prometheus metrics
-        KEYWORD_EFFECTIVENESS.labels(keyword=keyword).set(effectiveness_score)
+        _keyword_metrics(keyword)[2].set(effectiveness_score)
         
         logger.debug(
             f"Recorded classification for '{keyword}': "
@@ -208,31 +239,40 @@ class KeywordTracker:
         eff_key = f"keywords:effectiveness:{keyword}"
         window_key = f"keywords:search_window:{keyword}"
         
+        # Fetch every counter in one pipelined round-trip instead of eight
+        pipe = self.redis.pipeline(transaction=False)
+        pipe.get(hits_key)
+        pipe.hgetall(class_key)
+        pipe.get(success_key)
+        pipe.get(failure_key)
+        pipe.get(quality_key)
+        pipe.get(window_key)
+        pipe.lrange(eff_key, 0, -1)
+        pipe.lrange(rel_key, 0, -1)
+        (hits, classifications, success, failure, quality,
+         search_window, eff_scores, scores) = pipe.execute()
+        
         # Get hit count
-        hits = self.redis.get(hits_key)
         hit_count = int(hits) if hits else 0
         
         # Get classification stats
-        classifications = self.redis.hgetall(class_key)
         relevant_count = int(classifications.get(b'RELEVANT', 0)) if classifications else 0
         skip_count = int(classifications.get(b'SKIP', 0)) if classifications else 0
         total_classified = relevant_count + skip_count
         
         # Get success/failure counts
-        success_count = int(self.redis.get(success_key) or 0)
-        failure_count = int(self.redis.get(failure_key) or 0)
-        quality_count = int(self.redis.get(quality_key) or 0)
+        success_count = int(success or 0)
+        failure_count = int(failure or 0)
+        quality_count = int(quality or 0)
         
         # Calculate success rate
         success_rate = (relevant_count / total_classified) if total_classified > 0 else 0
         
         # Get search window (days back)
-        search_window = self.redis.get(window_key)
         search_days = int(search_window) if search_window else 7  # Default to 7 days
         
         # Get effectiveness scores
         effectiveness_scores = []
-        eff_scores = self.redis.lrange(eff_key, 0, -1)
         for score in eff_scores:
             try:
                 effectiveness_scores.append(float(score))
@@ -241,7 +281,6 @@ class KeywordTracker:
         
         # Get relevance scores (for backward compatibility)
         relevance_scores = []
-        scores = self.redis.lrange(rel_key, 0, -1)
         for score in scores:
             try:
                 relevance_scores.append(float(score))
@@ -368,21 +407,17 @@ class KeywordTracker:
         Returns:
             List of keyword statistics sorted by effectiveness
         """
-        # Get all keywords
-        pattern = self.hits_key.format(keyword='*')
-        pattern = pattern.replace('{keyword}', '*')
-        
+        # Get all keywords from the tracked index
+        self._ensure_tracked_index()
         all_stats = []
-        for key in self.redis.scan_iter(match=pattern):
-            # Extract keyword from key
-            key_str = key.decode('utf-8') if isinstance(key, bytes) else key
-            keyword = key_str.replace('keywords:hits:', '')
+        for member in self.redis.smembers(self.tracked_key):
+            keyword = member.decode('utf-8') if isinstance(member, bytes) else member
             
             stats = self.get_keyword_stats(keyword)
             all_stats.append(stats)
             
             # Update Prometheus gauge
-            KEYWORD_EFFECTIVENESS.labels(keyword=keyword).set(stats['effectiveness'])
+            _keyword_metrics(keyword)[2].set(stats['effectiveness'])
         
         # Sort by effectiveness
         all_stats.sort(key=lambda x: x['effectiveness'], reverse=True)
@@ -632,12 +667,10 @@ class KeywordTracker:
         hits_key = self.hits_key.format(keyword=keyword)
         rel_key = self.relevance_key.format(keyword=keyword)
         
-        self.redis.delete(hits_key)
-        self.redis.delete(rel_key)
-        
-        # Delete history
+        # Delete counters and history in a single DEL instead of one per key
         pattern = self.history_key.format(keyword=keyword, date='*')
-        for key in self.redis.scan_iter(match=pattern):
-            self.redis.delete(key)
+        history_keys = self.redis.scan_iter(match=pattern, count=500)
+        self.redis.delete(hits_key, rel_key, *history_keys)
+        self.redis.srem(self.tracked_key, keyword)
         
         logger.info(f"Reset tracking data for keyword: {keyword}")
\ No newline at end of file
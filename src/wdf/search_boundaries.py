@@ -108,12 +108,16 @@ class SearchBoundaryManager:
             with open(self.storage_path, 'w') as f:
                 json.dump(data, f, indent=2)
                 
-            # Also save to Redis if available
+            # Also save to Redis if available, in one pipelined round-trip
             if self.redis:
-                for keyword, boundary in self.boundaries.items():
-                    key = f"search:boundary:{keyword}"
-                    self.redis.set(key, json.dumps(boundary.to_dict()))
-                    self.redis.expire(key, 86400 * 30)  # Keep for 30 days
+                pipe = self.redis.pipeline(transaction=False)
+                for keyword, boundary_data in data.items():
+                    pipe.set(
+                        f"search:boundary:{keyword}",
+                        json.dumps(boundary_data),
+                        ex=86400 * 30  # Keep for 30 days
+                    )
+                pipe.execute()
                     
         except Exception as e:
             logger.error(f"Failed to save boundaries: {e}")
@@ -5,6 +5,7 @@ This module provides a typed configuration interface using pydantic-settings.
 Configuration can be loaded from settings.toml or environment variables.
 """
 
+from functools import cache
 from pathlib import Path
 
 from pydantic import Field
@@ -65,10 +66,14 @@ class WDFSettings(BaseSettings):
         return self.artefacts_dir / run_id
 
 
-# Global settings instance
-settings = WDFSettings()
+@cache
+def get_settings() -> WDFSettings:
+    """Get the global settings instance, building it on first use"""
+    return WDFSettings()
 
 
-def get_settings() -> WDFSettings:
-    """Get the global settings instance"""
-    return settings 
\ No newline at end of file
+def __getattr__(name: str) -> WDFSettings:
+    """Resolve the module-level ``settings`` lazily so importing this module stays cheap"""
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}") 
\ No newline at end of file
@@ -9,6 +9,7 @@ Integrates with: web_bridge.py (when WDF_WEB_MODE=true)
 import json
 import logging
 import os
+import re
 import subprocess
 import sys
 from pathlib import Path
@@ -93,6 +94,10 @@ FEWSHOTS_PATH = Path(settings.transcript_dir) / "fewshots.json"
 SUMMARY_PATH = Path(settings.transcript_dir) / "summary.md"
 CLASSIFIED_PATH = Path(settings.transcript_dir) / "classified.json"
 
+# tweet_classifier.py prints lines like "Score: 0.85 (Relevant) - RELEVANT";
+# matched against raw stdout bytes so only the captured scores get decoded
+SCORE_PATTERN = re.compile(rb"Score:\s*(\d*\.?\d+)")
+
 
 def load_tweets(file_manager=None) -> List[Dict]:
     """
@@ -152,17 +157,11 @@ def run_3n_classifier(tweets: List[Dict], fewshots_path: Path = FEWSHOTS_PATH, s
     Returns:
         List[Dict]: List of tweet dictionaries with relevance score and classification added
     """
-    # Create a temporary file with one tweet per line
-    tweets_file = Path("temp_tweets_to_classify.txt")
-    with open(tweets_file, "w") as f:
-        for tweet in tweets:
-            f.write(f"{tweet['text']}\n")
-    
     # Build the command
     cmd = [
         sys.executable,
         "tweet_classifier.py",
-        "--input-file", str(tweets_file),
+        "--input-file", "-",  # Tweets are piped in on stdin, one per line
         "--summary-file", str(summary_path),
         "--no-cache",  # Avoid caching for pipeline runs
         "--random",    # Use random examples for better diversity
@@ -182,29 +181,18 @@ def run_3n_classifier(tweets: List[Dict], fewshots_path: Path = FEWSHOTS_PATH, s
         with CLASSIFY_LATENCY.labels(run_id=run_id).time():
             result = subprocess.run(
                 cmd,
+                input="".join(f"{tweet['text']}\n" for tweet in tweets).encode(),
                 check=True,
-                capture_output=True,
-                text=True
+                capture_output=True
             )
             
-        # Parse the output using regex pattern matching
-        import re
         from ..score_utils import score_to_classification
         
-        # Look for lines like "Score: 0.85 (Relevant) - RELEVANT"
-        score_pattern = re.compile(r"Score:\s*(\d*\.?\d+)")
-        scores = []
-        
-        lines = result.stdout.splitlines()
-        tweet_index = 0
-        
-        for line in lines:
-            match = score_pattern.search(line)
-            if match:
-                score = float(match.group(1))
-                if tweet_index < len(tweets):
-                    scores.append(score)
-                    tweet_index += 1
+        # One scan over the output bytes; float() accepts the ASCII match directly
+        scores = [
+            float(match.group(1))
+            for match in SCORE_PATTERN.finditer(result.stdout)
+        ][:len(tweets)]
         
         # Add scores and classifications to tweets
         if len(scores) != len(tweets):
@@ -251,24 +239,17 @@ def run_3n_classifier(tweets: List[Dict], fewshots_path: Path = FEWSHOTS_PATH, s
         TWEETS_RELEVANT.inc(sum(1 for t in tweets if t.get("relevance_score", 0) >= RELEVANCY_THRESHOLD))
         TWEETS_SKIPPED.inc(sum(1 for t in tweets if t.get("relevance_score", 0) < RELEVANCY_THRESHOLD))
         
-        # Clean up
-        tweets_file.unlink()
-        
         return tweets
         
     except subprocess.CalledProcessError as e:
         logger.error(
             "tweet_classifier.py failed",
             returncode=e.returncode,
-            stdout=e.stdout,
-            stderr=e.stderr
+            stdout=e.stdout.decode(errors="replace"),
+            stderr=e.stderr.decode(errors="replace")
         )
         CLASSIFY_ERRORS.inc()
         
-        # Clean up
-        if tweets_file.exists():
-            tweets_file.unlink()
-            
         raise RuntimeError(f"tweet_classifier.py failed: {e}")
         
     except Exception as e:
@@ -278,10 +259,6 @@ def run_3n_classifier(tweets: List[Dict], fewshots_path: Path = FEWSHOTS_PATH, s
         )
         CLASSIFY_ERRORS.inc()
         
-        # Clean up
-        if tweets_file.exists():
-            tweets_file.unlink()
-            
         raise
 
 
@@ -113,7 +113,8 @@ Give higher scores to tweets that directly engage with the guest's arguments or
             # Still try to extract from summary if available
             _extract_minimal_context(transcripts_dir)
     
-    # Initialize Claude classifier
+    # Initialize Claude classifier (sequential and uncached: the SQLite cache
+    # and concurrent calls are opt-in via use_cache / max_workers)
     classifier = ClaudeClassifier(episode_id)
     
     # Extract tweet texts
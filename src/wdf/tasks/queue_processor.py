@@ -26,7 +26,7 @@ from pathlib import Path
 from typing import List, Dict, Any, Optional
 import structlog
 import psycopg2
-from psycopg2.extras import RealDictCursor
+from psycopg2.extras import execute_values, register_default_jsonb
 import os
 import sys
 from pydantic import BaseModel, Field
@@ -37,9 +37,44 @@ sys.path.append(str(Path(__file__).parent.parent.parent))
 from wdf.settings import WDFSettings
 from wdf.twitter_client import TwitterClient
 from wdf.web_bridge import WebBridge
+from wdf.json_utils import dumps, loads
+
+
+def _dumps(obj: Any) -> str:
+    # psycopg2 would send bytes as bytea, so hand it text for the jsonb casts
+    return dumps(obj).decode()
+
 
 logger = structlog.get_logger()
 
+# Claims pending items ordered by priority and marks them processing in a single
+# statement, so fetch and claim share one round-trip. Prepared once per connection.
+CLAIM_QUEUE_ITEMS_SQL = """
+    WITH picked AS (
+        SELECT id
+        FROM tweet_queue
+        WHERE status = 'pending'
+        ORDER BY priority DESC, added_at ASC
+        LIMIT $1
+        FOR UPDATE SKIP LOCKED
+    ), claimed AS (
+        UPDATE tweet_queue q
+        SET status = 'processing', processed_at = CURRENT_TIMESTAMP
+        FROM picked
+        WHERE q.id = picked.id
+        RETURNING q.*
+    )
+    SELECT 
+        c.*,
+        t.full_text as tweet_text,
+        t.author_handle,
+        t.author_name,
+        t.relevance_score
+    FROM claimed c
+    LEFT JOIN tweets t ON t.twitter_id = c.twitter_id
+    ORDER BY c.priority DESC, c.added_at ASC
+"""
+
 # Queue item model
 class QueueItem(BaseModel):
     """Model for queue items"""
@@ -68,6 +103,11 @@ class TweetQueueProcessor:
         self.web_bridge = WebBridge(settings)
         self.twitter_client = TwitterClient(settings)
         self.db_connection = None
+        self._claim_prepared = False
+        # While a batch is running, status updates are collected here and written together
+        self._status_buffer: Optional[List[tuple]] = None
+        # Events for buffered items are held back until their status is written
+        self._event_buffer: Optional[List[tuple]] = None
         self.processing = False
         self.processed_count = 0
         self.error_count = 0
@@ -89,6 +129,9 @@ class TweetQueueProcessor:
                 user=parsed.username,
                 password=parsed.password
             )
+            # Decode jsonb columns (tweet_queue.metadata) with the shared helper, on this connection only
+            register_default_jsonb(conn_or_curs=self.db_connection, loads=loads)
+            self._claim_prepared = False
             logger.info("Connected to database")
             return True
         except Exception as e:
@@ -104,42 +147,22 @@ class TweetQueueProcessor:
     def fetch_queue_items(self, batch_size: int = 10) -> List[QueueItem]:
         """Fetch pending items from queue"""
         try:
-            with self.db_connection.cursor(cursor_factory=RealDictCursor) as cursor:
-                # Fetch pending items ordered by priority
-                query = """
-                    SELECT 
-                        q.*,
-                        t.full_text as tweet_text,
-                        t.author_handle,
-                        t.author_name,
-                        t.relevance_score
-                    FROM tweet_queue q
-                    LEFT JOIN tweets t ON t.twitter_id = q.twitter_id
-                    WHERE q.status = 'pending'
-                    ORDER BY q.priority DESC, q.added_at ASC
-                    LIMIT %s
-                    FOR UPDATE SKIP LOCKED
-                """
-                cursor.execute(query, (batch_size,))
+            with self.db_connection.cursor() as cursor:
+                # Parse and plan the claim query once per connection instead of every poll
+                if not self._claim_prepared:
+                    cursor.execute(f"PREPARE claim_queue_items(int) AS {CLAIM_QUEUE_ITEMS_SQL}")
+                    self._claim_prepared = True
+                cursor.execute("EXECUTE claim_queue_items(%s)", (batch_size,))
                 rows = cursor.fetchall()
+                self.db_connection.commit()
                 
                 if not rows:
                     return []
                 
-                # Mark items as processing
-                ids = [row['id'] for row in rows]
-                update_query = """
-                    UPDATE tweet_queue 
-                    SET status = 'processing', processed_at = CURRENT_TIMESTAMP
-                    WHERE id = ANY(%s)
-                """
-                cursor.execute(update_query, (ids,))
-                self.db_connection.commit()
-                
-                # Convert to QueueItem objects
-                items = []
-                for row in rows:
-                    items.append(QueueItem(**row))
+                # Convert to QueueItem objects, reading column names once
+                # rather than building a dict per row in the cursor
+                columns = [desc[0] for desc in cursor.description]
+                items = [QueueItem(**dict(zip(columns, row))) for row in rows]
                 
                 logger.info(
                     "Fetched queue items",
@@ -161,6 +184,11 @@ class TweetQueueProcessor:
         error_message: Optional[str] = None
     ):
         """Update queue item status"""
+        if self._status_buffer is not None:
+            # Inside process_batch - deferred to one bulk write for the whole batch
+            self._status_buffer.append((item_id, status, error_message))
+            return
+        
         try:
             with self.db_connection.cursor() as cursor:
                 if status == 'failed':
@@ -177,7 +205,7 @@ class TweetQueueProcessor:
                         WHERE id = %s
                     """
                     cursor.execute(query, (
-                        json.dumps({"last_error": error_message}),
+                        _dumps({"last_error": error_message}),
                         item_id
                     ))
                 else:
@@ -201,6 +229,82 @@ class TweetQueueProcessor:
             if self.db_connection:
                 self.db_connection.rollback()
     
+    def flush_status_updates(self, updates: List[tuple]) -> bool:
+        """
+        Write buffered status updates with one statement per outcome type
+        
+        Args:
+            updates: (item_id, status, error_message) tuples in the order they were made
+            
+        Returns:
+            True if the updates were committed (or there were none), False if rolled back
+        """
+        if not updates:
+            return True
+        
+        # Same semantics as update_item_status: failures bump retry_count and
+        # requeue, anything else sets the status. Failures are applied last so an
+        # item that completed and then failed ends up failed, as it would serially.
+        failed = [
+            (item_id, _dumps({"last_error": error_message}))
+            for item_id, status, error_message in updates
+            if status == 'failed'
+        ]
+        other = [
+            (item_id, status)
+            for item_id, status, _ in updates
+            if status != 'failed'
+        ]
+        
+        try:
+            with self.db_connection.cursor() as cursor:
+                if other:
+                    execute_values(cursor, """
+                        UPDATE tweet_queue AS q
+                        SET status = v.status
+                        FROM (VALUES %s) AS v(id, status)
+                        WHERE q.id = v.id
+                    """, other)
+                if failed:
+                    execute_values(cursor, """
+                        UPDATE tweet_queue AS q
+                        SET 
+                            status = CASE 
+                                WHEN q.retry_count < 3 THEN 'pending'
+                                ELSE 'failed'
+                            END,
+                            retry_count = q.retry_count + 1,
+                            metadata = q.metadata || v.error::jsonb
+                        FROM (VALUES %s) AS v(id, error)
+                        WHERE q.id = v.id
+                    """, failed)
+                
+                self.db_connection.commit()
+            return True
+                
+        except Exception as e:
+            logger.error(
+                "Failed to update item statuses",
+                count=len(updates),
+                error=str(e)
+            )
+            if self.db_connection:
+                self.db_connection.rollback()
+            return False
+    
+    async def _send_event(self, event_type: str, data: Dict[str, Any]):
+        """
+        Send a web UI event, or hold it until the batch's status updates are written
+        
+        Args:
+            event_type: Event name passed to WebBridge.send_event
+            data: Event payload
+        """
+        if self._event_buffer is not None:
+            self._event_buffer.append((event_type, data))
+            return
+        await self.web_bridge.send_event(event_type, data)
+    
     async def process_item(self, item: QueueItem) -> bool:
         """Process a single queue item"""
         try:
@@ -255,7 +359,7 @@ class TweetQueueProcessor:
             self.processed_count += 1
             
             # Send real-time update
-            await self.web_bridge.send_event(
+            await self._send_event(
                 "tweet_processed",
                 {
                     "queue_id": item.id,
@@ -289,9 +393,31 @@ class TweetQueueProcessor:
             logger.info("No pending items in queue")
             return 0
         
-        # Process items concurrently
-        tasks = [self.process_item(item) for item in items]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        # Process items concurrently, collecting their status updates
+        self._status_buffer = []
+        self._event_buffer = []
+        try:
+            tasks = [self.process_item(item) for item in items]
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+        finally:
+            updates, self._status_buffer = self._status_buffer, None
+            events, self._event_buffer = self._event_buffer, None
+            flushed = self.flush_status_updates(updates)
+        
+        # Only announce items once the web UI can read their new status
+        if flushed:
+            for event_type, data in events:
+                try:
+                    await self.web_bridge.send_event(event_type, data)
+                except Exception as e:
+                    logger.error(
+                        "Failed to send queue event",
+                        event_type=event_type,
+                        queue_id=data.get("queue_id"),
+                        error=str(e)
+                    )
+        elif events:
+            logger.warning("Dropping queue events for unsaved status updates", count=len(events))
         
         # Count successful processing
         success_count = sum(1 for r in results if r is True)
@@ -23,6 +23,10 @@ class WDFWatchTokenManager:
         self.token_info_path = Path(__file__).parent.parent.parent / ".wdfwatch_token_info.json"
         self.token_url = "https://api.x.com/2/oauth2/token"
         
+        # One keep-alive session for refresh and verify calls so repeat calls
+        # skip the TLS handshake
+        self.session = requests.Session()
+        
         # Load environment
         self._load_environment()
         
@@ -116,7 +120,7 @@ class WDFWatchTokenManager:
         auth = (client_id, client_secret)
         
         try:
-            response = requests.post(
+            response = self.session.post(
                 self.token_url,
                 data=data,
                 auth=auth,
@@ -180,21 +184,32 @@ class WDFWatchTokenManager:
         except Exception as e:
             logger.error(f"Error saving token info: {e}")
     
+    def _get_me(self, access_token: str) -> requests.Response:
+        """Call users/me with the given token over the shared session."""
+        return self.session.get(
+            "https://api.twitter.com/2/users/me",
+            headers={"Authorization": f"Bearer {access_token}"},
+            timeout=5
+        )
+    
     def verify_account(self, access_token: str) -> Tuple[bool, str]:
         """
         Verify the token belongs to WDFwatch account.
         
+        If the token is rejected (401), it is refreshed once and the check is
+        repeated with the new token, all on the same session.
+        
         Returns:
             Tuple of (is_correct_account, username)
         """
-        headers = {"Authorization": f"Bearer {access_token}"}
-        
         try:
-            response = requests.get(
-                "https://api.twitter.com/2/users/me",
-                headers=headers,
-                timeout=5
-            )
+            response = self._get_me(access_token)
+            
+            if response.status_code == 401:
+                logger.info("Token rejected by users/me, refreshing and re-verifying...")
+                new_token = self._refresh_token()
+                if new_token:
+                    response = self._get_me(new_token)
             
             if response.status_code == 200:
                 user_data = response.json()
@@ -0,0 +1,65 @@
+"""
+Unit tests for duplicate handling in the Claude classifier's classify_batch
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "claude-classifier"))
+
+from classify import ClassificationCache, ClaudeClassifier
+
+
+@pytest.fixture
+def classifier(monkeypatch):
+    """Uncached classifier whose Claude calls score tweet N as 0.N"""
+    prompts = []
+
+    def fake_call(self, prompt):
+        prompts.append(prompt)
+        count = len(_sent_tweets([prompt]))
+        return "\n".join(f"{i}\t0.{i}" for i in range(1, count + 1))
+
+    monkeypatch.setattr(ClaudeClassifier, "_call_claude", fake_call)
+    clf = ClaudeClassifier(use_cache=False)
+    clf.prompts = prompts
+    return clf
+
+
+def _sent_tweets(prompts):
+    """Tweet lines ('N. text') across all prompts sent to Claude"""
+    lines = []
+    for prompt in prompts:
+        body = prompt.split("TWEETS:\n", 1)[1].split("\n\nSCORES", 1)[0]
+        lines.extend(line.split(". ", 1)[1] for line in body.splitlines())
+    return lines
+
+
+def test_exact_duplicates_are_sent_once(classifier):
+    """Repeated tweets go to Claude once and get the same result back"""
+    results = classifier.classify_batch(["alpha", "beta", "alpha"])
+
+    assert _sent_tweets(classifier.prompts) == ["alpha", "beta"]
+    assert [r["text"] for r in results] == ["alpha", "beta", "alpha"]
+    assert results[0]["score"] == results[2]["score"]
+    assert results[0]["score"] != results[1]["score"]
+
+
+def test_case_and_whitespace_variants_share_a_score(classifier):
+    """Tweets that differ only in case or spacing count as duplicates"""
+    results = classifier.classify_batch(["Go  Home", "go home", "gone home"])
+
+    assert _sent_tweets(classifier.prompts) == ["Go  Home", "gone home"]
+    # Each result keeps its own original text
+    assert [r["text"] for r in results] == ["Go  Home", "go home", "gone home"]
+    assert results[0]["score"] == results[1]["score"]
+    assert results[0]["score"] != results[2]["score"]
+
+
+def test_cache_key_uses_normalize():
+    """Texts with the same normalized form share a cache key"""
+    assert ClassificationCache.normalize("  Go\tHOME  now ") == "go home now"
+    assert ClassificationCache.make_key("ctx", "Go  Home") == ClassificationCache.make_key("ctx", "go home")
+    assert ClassificationCache.make_key("ctx", "go home") != ClassificationCache.make_key("ctx", "gone home")
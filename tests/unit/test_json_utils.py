@@ -0,0 +1,26 @@
+"""
+Unit tests for the shared JSON helpers
+"""
+
+import pytest
+
+import wdf.json_utils as json_utils
+
+SAMPLE = {"text": "café", "scores": [0.5, 1], "meta": {"ok": True, "none": None}, 7: "int key"}
+
+
+@pytest.mark.parametrize("indent", [False, True])
+def test_stdlib_fallback_matches_orjson(monkeypatch, indent):
+    """Both backends write the same bytes, so their files are interchangeable"""
+    pytest.importorskip("orjson")
+    fast = json_utils.dumps(SAMPLE, indent=indent)
+    monkeypatch.setattr(json_utils, "orjson", None)
+    assert json_utils.dumps(SAMPLE, indent=indent) == fast
+
+
+def test_round_trip_without_orjson(monkeypatch):
+    """The fallback reads bytes and str, stringifying non-str keys like json does"""
+    monkeypatch.setattr(json_utils, "orjson", None)
+    data = json_utils.dumps(SAMPLE, indent=True)
+    assert json_utils.loads(data) == json_utils.loads(data.decode())
+    assert json_utils.loads(data)["7"] == "int key"
@@ -0,0 +1,136 @@
+"""
+Unit tests for the queue processor's batched status updates
+"""
+
+import asyncio
+import json
+import sys
+import types
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+# wdf.web_bridge isn't part of this tree; the processor only needs the name
+if "wdf.web_bridge" not in sys.modules:
+    try:
+        import wdf.web_bridge  # noqa: F401
+    except ImportError:
+        sys.modules["wdf.web_bridge"] = types.SimpleNamespace(WebBridge=MagicMock)
+
+from wdf.tasks import queue_processor
+from wdf.tasks.queue_processor import QueueItem, TweetQueueProcessor
+
+
+@pytest.fixture
+def processor():
+    """Processor with a fake connection and web bridge"""
+    with patch.object(queue_processor, "WebBridge"), \
+            patch.object(queue_processor, "TwitterClient"):
+        proc = TweetQueueProcessor(MagicMock())
+    proc.db_connection = MagicMock()
+    proc.web_bridge.send_event = AsyncMock()
+    return proc
+
+
+def _item(item_id):
+    """A queue item that process_item completes without fetching or scoring"""
+    return QueueItem(
+        id=item_id, tweet_id=f"t{item_id}", twitter_id=f"t{item_id}", source="manual",
+        priority=1, status="processing", added_at=queue_processor.datetime.now(),
+        tweet_text="text", relevance_score=0.9
+    )
+
+
+def _statements(mock_execute_values):
+    """Collapse execute_values calls to (sql, rows) pairs"""
+    return [(c.args[1], c.args[2]) for c in mock_execute_values.call_args_list]
+
+
+def test_flush_status_updates_non_failed(processor):
+    """Completed items are written with one UPDATE ... FROM (VALUES ...)"""
+    with patch.object(queue_processor, "execute_values") as ev:
+        assert processor.flush_status_updates([(1, "completed", None), (2, "completed", None)])
+
+    statements = _statements(ev)
+    assert len(statements) == 1
+    sql, rows = statements[0]
+    assert "SET status = v.status" in sql
+    assert rows == [(1, "completed"), (2, "completed")]
+    processor.db_connection.commit.assert_called_once()
+
+
+def test_flush_status_updates_failed(processor):
+    """Failed items bump retry_count and record the error"""
+    with patch.object(queue_processor, "execute_values") as ev:
+        assert processor.flush_status_updates([(3, "failed", "boom")])
+
+    statements = _statements(ev)
+    assert len(statements) == 1
+    sql, rows = statements[0]
+    assert "retry_count = q.retry_count + 1" in sql
+    assert rows[0][0] == 3
+    assert json.loads(rows[0][1]) == {"last_error": "boom"}
+    processor.db_connection.commit.assert_called_once()
+
+
+def test_flush_status_updates_mixed_applies_failures_last(processor):
+    """Both groups go out in one transaction, failures after the rest"""
+    with patch.object(queue_processor, "execute_values") as ev:
+        processor.flush_status_updates([
+            (1, "completed", None),
+            (2, "failed", "timeout"),
+            (1, "failed", "late error"),
+        ])
+
+    (other_sql, other_rows), (failed_sql, failed_rows) = _statements(ev)
+    assert "SET status = v.status" in other_sql
+    assert other_rows == [(1, "completed")]
+    assert "retry_count" in failed_sql
+    assert [row[0] for row in failed_rows] == [2, 1]
+    processor.db_connection.commit.assert_called_once()
+
+
+def test_flush_status_updates_rolls_back_on_error(processor):
+    """A failed bulk write is rolled back instead of committed"""
+    with patch.object(queue_processor, "execute_values", side_effect=Exception("db down")):
+        assert not processor.flush_status_updates([(1, "completed", None)])
+
+    processor.db_connection.rollback.assert_called_once()
+    processor.db_connection.commit.assert_not_called()
+
+
+def test_process_batch_sends_events_after_flush(processor):
+    """tweet_processed events only go out once the statuses are written"""
+    order = []
+    processor.fetch_queue_items = MagicMock(return_value=[_item(7)])
+    processor.flush_status_updates = MagicMock(
+        side_effect=lambda updates: order.append(("flush", updates)) or True
+    )
+    processor.web_bridge.send_event = AsyncMock(
+        side_effect=lambda event_type, data: order.append(("event", event_type))
+    )
+
+    assert asyncio.run(processor.process_batch()) == 1
+    assert order == [
+        ("flush", [(7, "completed", None)]),
+        ("event", "tweet_processed"),
+    ]
+
+
+def test_process_batch_drops_events_when_flush_fails(processor):
+    """No events are sent for statuses that were rolled back"""
+    processor.fetch_queue_items = MagicMock(return_value=[_item(7)])
+    processor.flush_status_updates = MagicMock(return_value=False)
+
+    asyncio.run(processor.process_batch())
+    processor.web_bridge.send_event.assert_not_called()
+
+
+def test_process_batch_continues_after_failed_event_send(processor):
+    """One failed event send doesn't stop the rest of the batch's events"""
+    processor.fetch_queue_items = MagicMock(return_value=[_item(7), _item(8)])
+    processor.flush_status_updates = MagicMock(return_value=True)
+    processor.web_bridge.send_event = AsyncMock(side_effect=[Exception("ws down"), None])
+
+    assert asyncio.run(processor.process_batch()) == 2
+    assert processor.web_bridge.send_event.await_count == 2
@@ -7,7 +7,8 @@ from pathlib import Path
 
 import pytest
 
-from wdf.settings import WDFSettings, LLMModels
+import wdf.settings as settings_module
+from wdf.settings import WDFSettings, LLMModels, get_settings
 
 
 def test_default_settings():
@@ -65,4 +66,13 @@ def test_run_dir():
     
     run_dir = settings.get_run_dir(run_id)
     
-    assert run_dir == Path("artefacts") / run_id 
\ No newline at end of file
+    assert run_dir == Path("artefacts") / run_id 
+
+
+def test_global_settings_singleton():
+    """Test that the module-level settings resolve to one cached instance"""
+    assert get_settings() is get_settings()
+    assert settings_module.settings is get_settings()
+    
+    with pytest.raises(AttributeError):
+        settings_module.not_a_setting
@@ -338,12 +338,14 @@ def read_tweets_from_file(file_path: str) -> List[str]:
     Read tweets from a file, one per line
     
     Args:
-        file_path: Path to the file containing tweets
+        file_path: Path to the file containing tweets, or "-" for stdin
         
     Returns:
         List of tweets
     """
     try:
+        if file_path == "-":
+            return [line.strip() for line in sys.stdin if line.strip()]
         with open(file_path, 'r', encoding='utf-8') as f:
             # Read all lines and filter out empty ones
             return [line.strip() for line in f if line.strip()]
@@ -439,6 +441,134 @@ def process_batch(tweets: List[str], client: Client, model: str, examples: List,
     if use_cache:
         save_cache(cache)
 
+def select_examples(num_examples: int, max_examples: Optional[int] = None,
+                    random_examples: bool = False, pool: Optional[List] = None) -> List:
+    """
+    Pick the few-shot examples to use for classification
+    
+    Args:
+        num_examples: Number of examples to use
+        max_examples: Only draw from the first N examples, if given
+        random_examples: Randomly select balanced examples instead of taking the first N
+        pool: Examples to choose from (defaults to FEW_SHOT_EXAMPLES)
+        
+    Returns:
+        List of [tweet, label] examples
+    """
+    if pool is None:
+        pool = FEW_SHOT_EXAMPLES
+    
+    if max_examples:
+        # If max_examples is specified, use only the first N examples
+        limited_examples = pool[:max_examples]
+        logging.info(f"Using only the first {len(limited_examples)} examples (limited by --max-examples)")
+        
+        if random_examples:
+            examples = select_balanced_examples(limited_examples, num_examples)
+            logging.info(f"Using {len(examples)} randomly selected examples from the first {len(limited_examples)}")
+        else:
+            examples = limited_examples[:num_examples]
+            logging.info(f"Using first {len(examples)} examples from limited set of {len(limited_examples)}")
+    elif random_examples:
+        examples = select_balanced_examples(pool, num_examples)
+        logging.info(f"Using {len(examples)} randomly selected examples ({len(examples)//2} RELEVANT, {len(examples)//2} SKIP)")
+    else:
+        examples = pool[:num_examples]
+        logging.info(f"Using first {len(examples)} examples from few_shot_examples.py")
+    
+    return examples
+
+def score_tweets(texts: List[str], max_examples: Optional[int] = None, random: bool = False,
+                 num_examples: int = DEFAULT_EXAMPLES, model: str = DEFAULT_MODEL,
+                 host: str = DEFAULT_HOST, summary_file: Optional[str] = DEFAULT_SUMMARY_PATH,
+                 workers: int = DEFAULT_MAX_WORKERS, fewshots: Optional[List] = None) -> List[Optional[float]]:
+    """
+    Score tweets in-process, for callers that would otherwise run this script
+    
+    The response cache is not used, matching the --no-cache pipeline runs.
+    
+    Args:
+        texts: Tweet texts to score
+        max_examples: Only draw examples from the first N few-shots
+        random: Randomly select examples instead of using the first N
+        num_examples: Number of examples to use
+        model: Model name ("claude" uses the Claude wrapper, like main())
+        host: Ollama API host
+        summary_file: Path to summary file providing topic context, or None
+        workers: Maximum number of parallel workers
+        fewshots: Few-shot examples to draw from (defaults to FEW_SHOT_EXAMPLES)
+        
+    Returns:
+        List of relevancy scores (0.00-1.00) in the same order as texts,
+        with None for tweets that could not be scored
+    """
+    if not texts:
+        return []
+    
+    examples = select_examples(num_examples, max_examples, random, fewshots)
+    topic_summary = read_summary_file(summary_file) if summary_file else None
+    
+    if model == "claude":
+        import importlib.util
+        claude_script = Path(__file__).parent / "scripts" / "claude_classifier.py"
+        spec = importlib.util.spec_from_file_location("claude_classifier", claude_script)
+        claude_classifier = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(claude_classifier)
+        scores = claude_classifier.classify_tweets_batch(texts, topic_summary or "", examples)
+    else:
+        client = Client(host=host)
+        results = batch_classify(
+            texts, client, model, examples, {}, calculate_examples_hash(examples),
+            False, workers, topic_summary, calculate_summary_hash(topic_summary)
+        )
+        scores = [score for _, score in results]
+    
+    for i, (text, score) in enumerate(zip(texts, scores)):
+        if not isinstance(score, (int, float)):
+            # classify_tweet reports API errors as an "ERROR: ..." string
+            logging.warning(f"No score for tweet '{text[:30]}...': {score}")
+            scores[i] = None
+    
+    return scores
+
+def classify(texts: List[str], max_examples: Optional[int] = 5, random: bool = True,
+             debug: bool = False, **kwargs) -> List[str]:
+    """
+    Classify tweets in-process as RELEVANT or SKIP
+    
+    Args:
+        texts: Tweet texts to classify
+        max_examples: Only draw examples from the first N few-shots
+        random: Randomly select examples instead of using the first N
+        debug: Log each tweet's score and label, like main()'s --debug
+        **kwargs: Further options passed to score_tweets
+        
+    Returns:
+        List of "RELEVANT"/"SKIP" classifications in the same order as texts
+        
+    Raises:
+        ValueError: If any tweet could not be scored (e.g. the model is unreachable)
+    """
+    scores = score_tweets(texts, max_examples, random, **kwargs)
+    
+    # A failed model call must fail the run, not quietly label the tweet SKIP
+    failed = sum(1 for score in scores if score is None)
+    if failed:
+        logging.error(f"{failed} of {len(texts)} tweets could not be scored")
+        raise ValueError(f"Failed to score {failed} of {len(texts)} tweets")
+    
+    if score_to_classification:
+        labels = [score_to_classification(score) for score in scores]
+    else:
+        labels = ["RELEVANT" if score >= 0.70 else "SKIP" for score in scores]
+    
+    if debug:
+        for text, score, label in zip(texts, scores, labels):
+            logging.debug(f"Tweet: {text}")
+            logging.debug(f"Score: {score:.2f} - {label}")
+    
+    return labels
+
 def main() -> None:
     """Main function to run the tweet classifier"""
     # Check if Claude is selected for classification
@@ -472,7 +602,7 @@ def main() -> None:
     parser.add_argument("--batch", action="store_true", 
                         help="Enable interactive batch processing mode")
     parser.add_argument("--input-file", type=str, 
-                        help="Path to file containing tweets to process (one per line)")
+                        help="Path to file containing tweets to process (one per line, '-' for stdin)")
     parser.add_argument("--workers", type=int, default=DEFAULT_MAX_WORKERS,
                         help=f"Maximum number of parallel workers (default: {DEFAULT_MAX_WORKERS})")
     parser.add_argument("--summary-file", type=str, default=DEFAULT_SUMMARY_PATH,
@@ -490,23 +620,7 @@ def main() -> None:
     )
 
     # Select examples based on command line args
-    if args.max_examples:
-        # If max_examples is specified, use only the first N examples
-        limited_examples = FEW_SHOT_EXAMPLES[:args.max_examples]
-        logging.info(f"Using only the first {len(limited_examples)} examples (limited by --max-examples)")
-        
-        if args.random:
-            examples = select_balanced_examples(limited_examples, args.examples)
-            logging.info(f"Using {len(examples)} randomly selected examples from the first {len(limited_examples)}")
-        else:
-            examples = limited_examples[:args.examples]
-            logging.info(f"Using first {len(examples)} examples from limited set of {len(limited_examples)}")
-    elif args.random:
-        examples = select_balanced_examples(FEW_SHOT_EXAMPLES, args.examples)
-        logging.info(f"Using {len(examples)} randomly selected examples ({len(examples)//2} RELEVANT, {len(examples)//2} SKIP)")
-    else:
-        examples = FEW_SHOT_EXAMPLES[:args.examples]
-        logging.info(f"Using first {len(examples)} examples from few_shot_examples.py")
+    examples = select_examples(args.examples, args.max_examples, args.random)
     
     # Read summary file if specified
     topic_summary = None
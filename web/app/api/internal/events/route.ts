@@ -20,19 +20,23 @@ export async function POST(request: NextRequest) {
       )
     }
 
-    // Get event from request body
-    const event = await request.json()
+    // Get event(s) from request body - the bridge sends an array when
+    // several events were queued at once
+    const body = await request.json()
+    const events = Array.isArray(body) ? body : [body]
 
-    // Validate event has required type field
-    if (!event.type) {
+    // Validate every event has the required type field
+    if (events.length === 0 || events.some((event) => !event?.type)) {
       return NextResponse.json(
         { error: "Event type is required" },
         { status: 400 }
       )
     }
 
-    // Emit the event to all connected SSE clients
-    await eventEmitter.broadcast(event)
+    // Emit the events, in order, to all connected SSE clients
+    for (const event of events) {
+      await eventEmitter.broadcast(event)
+    }
 
     return NextResponse.json({ success: true })
   } catch (error) {
@@ -0,0 +1,8 @@
+-- Partial index matching the queue processor's claim query:
+--   WHERE status = 'pending' ORDER BY priority DESC, added_at ASC LIMIT n FOR UPDATE SKIP LOCKED
+-- Only pending rows are indexed, so it stays small as completed rows accumulate
+-- and the planner can read the top-N rows straight off the index without a sort.
+-- (Partial indexes can't be expressed in schema.prisma, so this lives here only.)
+CREATE INDEX IF NOT EXISTS idx_tweet_queue_pending_priority
+  ON tweet_queue(priority DESC, added_at ASC)
+  WHERE status = 'pending';
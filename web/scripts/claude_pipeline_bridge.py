@@ -52,6 +52,16 @@ class ClaudePipelineBridge(WebUIBridge):
         self.load_llm_configuration()
         self.load_stage_configuration()
         
+        # Environment for orchestrator subprocesses, built once per bridge. This
+        # must come after the loaders above, which export the user's model choices
+        # and stage toggles into os.environ.
+        self.orchestrator_env = {
+            **os.environ,
+            'WDF_WEB_MODE': 'true',
+            'WDF_EPISODE_ID': str(episode_id) if episode_id else '',
+            'PYTHONPATH': str(self.project_root)
+        }
+        
         logger.info(f"Claude Pipeline Bridge initialized for episode {episode_id}")
         logger.info(f"Orchestrator path: {self.orchestrator_path}")
         logger.info(f"Episodes directory: {self.episodes_dir}")
@@ -221,21 +231,13 @@ class ClaudePipelineBridge(WebUIBridge):
             # Add stage-specific arguments (use --stages which works for single or multiple)
             cmd.extend(['--stages', stage])
             
-            # Set up environment for orchestrator
-            env = os.environ.copy()
-            env.update({
-                'WDF_WEB_MODE': 'true',
-                'WDF_EPISODE_ID': str(self.episode_id) if self.episode_id else '',
-                'PYTHONPATH': str(self.project_root)
-            })
-            
             logger.info(f"Running orchestrator command: {' '.join(cmd)}")
             
             # Run orchestrator with explicit stdin handling
             result = subprocess.run(
                 cmd,
                 cwd=self.project_root,
-                env=env,
+                env=self.orchestrator_env,
                 stdin=subprocess.DEVNULL,  # Prevent any stdin reading
                 capture_output=True,
                 text=True,
@@ -375,6 +377,8 @@ class ClaudePipelineBridge(WebUIBridge):
             'drafts_created': result.get('drafts_created', 0),
             'timestamp': datetime.now().isoformat()
         })
+        # Deliver the stage result before the caller moves on to the next stage
+        self.flush_events()
         
         return result
 
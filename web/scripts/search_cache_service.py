@@ -258,7 +258,8 @@ class SearchCacheService:
                     ORDER BY created_at DESC
                 """, list(all_tweet_ids))
                 
-                tweets = [dict(row) for row in cursor.fetchall()]
+                # RealDictRow is already a dict - no need to copy each row
+                tweets = cursor.fetchall()
                 
                 logger.info(f"Retrieved {len(tweets)} cached tweets from database")
                 
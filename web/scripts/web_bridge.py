@@ -6,17 +6,105 @@ Emits SSE events and updates database when pipeline stages complete
 """
 
 import os
+import sys
 import json
+import atexit
 import logging
+import queue
+import threading
 from datetime import datetime
 from decimal import Decimal
+from pathlib import Path
 from typing import List, Dict, Optional, Any, Union
 import httpx
 import psycopg2
 from psycopg2.extras import RealDictCursor
+from psycopg2.pool import PoolError
+
+# Shared connection pools and JSON helpers come from the wdf package. src/ is
+# appended so it can't shadow other modules, and the pools are only ever loaded
+# as wdf.db_pool.
+_src_path = str(Path(__file__).parent.parent.parent / "src")
+if _src_path not in sys.path:
+    sys.path.append(_src_path)
+try:
+    from wdf.db_pool import get_db_pool, release_connection
+    from wdf.json_utils import dumps
+except ImportError as e:
+    # Callers treat ImportError as "no web bridge"; don't let this silently disable DB sync
+    raise RuntimeError(f"web_bridge could not import the wdf package: {e}") from e
 
 logger = logging.getLogger(__name__)
 
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+class _EventPublisher:
+    """Posts SSE events to the web UI from a background thread"""
+    
+    def __init__(self):
+        self._queue: "queue.Queue[tuple]" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        
+    def submit(self, url: str, headers: Dict[str, str], event: Dict) -> None:
+        """Queue an event for delivery without waiting on the HTTP round-trip"""
+        if self._thread is None:
+            with self._lock:
+                if self._thread is None:
+                    self._thread = threading.Thread(target=self._run, name="sse-publisher", daemon=True)
+                    self._thread.start()
+        self._queue.put_nowait((url, headers, event))
+        
+    def flush(self) -> None:
+        """Block until every queued event has been sent (or failed)"""
+        if self._thread is not None:
+            self._queue.join()
+            
+    def _drain(self) -> List[tuple]:
+        """Block for the next event, then take everything else already queued"""
+        pending = [self._queue.get()]
+        while True:
+            try:
+                pending.append(self._queue.get_nowait())
+            except queue.Empty:
+                return pending
+            
+    def _run(self) -> None:
+        # One keep-alive client for the life of the process instead of one per event
+        with httpx.Client() as client:
+            while True:
+                pending = self._drain()
+                # Events that piled up while the last request was in flight go out
+                # together as one JSON array per endpoint
+                start = 0
+                while start < len(pending):
+                    url, headers, _ = pending[start]
+                    end = start + 1
+                    while end < len(pending) and pending[end][0] == url and pending[end][1] == headers:
+                        end += 1
+                    events = [event for _, _, event in pending[start:end]]
+                    self._post(client, url, headers, events)
+                    start = end
+                for _ in pending:
+                    self._queue.task_done()
+                    
+    def _post(self, client: httpx.Client, url: str, headers: Dict[str, str], events: List[Dict]) -> None:
+        body = events[0] if len(events) == 1 else events
+        try:
+            response = client.post(url, content=dumps(body), headers=headers)
+            response.raise_for_status()
+            logger.info(f"SSE events emitted: {', '.join(event['type'] for event in events)}")
+        except Exception as e:
+            logger.error(f"Failed to emit SSE events: {e}")
+
+
+_event_publisher = _EventPublisher()
+
+
+# Registered after the db_pool hook (imported above) so it runs first and
+# pending events still go out
+atexit.register(_event_publisher.flush)
+
 class WebUIBridge:
     """Bridge between Python pipeline and web UI database/SSE events"""
     
@@ -27,28 +115,47 @@ class WebUIBridge:
         self.db_url = raw_db_url.split('?')[0]  # Strip all query parameters
         self.web_url = os.getenv("WEB_URL", "http://localhost:3000")
         self.api_key = os.getenv("WEB_API_KEY", "development-internal-api-key")
+        self._events_url = f"{self.web_url}/api/internal/events"
+        self._event_headers = {**_JSON_HEADERS, "X-API-Key": self.api_key}
         self._connection = None
+        self._pooled = False
         
     @property
     def connection(self):
-        """Lazy database connection"""
+        """Lazy database connection, checked out of the shared pool"""
         if self._connection is None or self._connection.closed:
-            self._connection = psycopg2.connect(self.db_url)
+            self.close()
+            try:
+                self._connection = get_db_pool(self.db_url).getconn()
+                self._pooled = True
+            except PoolError:
+                # Pool exhausted by long-lived bridges - fall back to a private connection
+                logger.debug("Database pool exhausted, opening a dedicated connection")
+                self._connection = psycopg2.connect(self.db_url)
+                self._pooled = False
         return self._connection
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+    
+    def __del__(self):
+        # A bridge that is never closed must not keep its pooled connection
+        # checked out for the life of the process
+        try:
+            self.close()
+        except Exception:
+            pass
         
     def emit_sse_event(self, event: Dict) -> None:
-        """Emit SSE event to web UI"""
-        try:
-            with httpx.Client() as client:
-                response = client.post(
-                    f"{self.web_url}/api/internal/events",
-                    json=event,
-                    headers={"X-API-Key": self.api_key}
-                )
-                response.raise_for_status()
-                logger.info(f"SSE event emitted: {event['type']}")
-        except Exception as e:
-            logger.error(f"Failed to emit SSE event: {e}")
+        """Emit SSE event to web UI (delivered in order by a background thread)"""
+        _event_publisher.submit(self._events_url, self._event_headers, event)
+        
+    def flush_events(self) -> None:
+        """Wait for all emitted SSE events to be delivered"""
+        _event_publisher.flush()
             
     def notify_pipeline_start(self, stage: str) -> None:
         """Notify that a pipeline stage has started"""
@@ -67,6 +174,8 @@ class WebUIBridge:
             "status": "completed",
             "timestamp": datetime.utcnow().isoformat()
         })
+        # End-of-stage status must reach the UI before the caller moves on
+        self.flush_events()
         
     def notify_pipeline_error(self, stage: str, error: str) -> None:
         """Notify that a pipeline stage has failed"""
@@ -77,6 +186,7 @@ class WebUIBridge:
             "message": error,
             "timestamp": datetime.utcnow().isoformat()
         })
+        self.flush_events()
         
     def sync_tweets(self, tweets: List[Dict]) -> None:
         """Sync tweets from pipeline to database"""
@@ -755,9 +865,15 @@ class WebUIBridge:
         pass
     
     def close(self):
-        """Close database connection"""
-        if self._connection and not self._connection.closed:
+        """Release database connection back to the pool (or close it if not pooled)"""
+        if self._connection is None:
+            return
+        if self._pooled:
+            release_connection(self.db_url, self._connection)
+        elif not self._connection.closed:
             self._connection.close()
+        self._connection = None
+        self._pooled = False
 
 
 # Integration functions for use in existing pipeline tasks
@@ -809,9 +925,6 @@ def sync_responses_to_database(responses_file: str, episode_dir: str = None) ->
     
     try:
         # Load responses from file
-        import json
-        from pathlib import Path
-        
         responses_path = Path(responses_file)
         if not responses_path.exists():
             logger.warning(f"Responses file not found: {responses_file}")